@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Sequence
 import time
@@ -165,14 +165,14 @@ class _ToolCallState:
     output_fragments: List[Any] = field(default_factory=list)
     error: bool = False
 
-    def record_start(self) -> None:
+    def record_start(self, at: datetime, perf_timestamp: float) -> None:
         if self.started_at is None:
-            self.started_at = _utc_now()
-            self.started_perf = time.perf_counter()
+            self.started_at = at
+            self.started_perf = perf_timestamp
 
-    def record_completion(self) -> None:
-        self.completed_at = _utc_now()
-        self.completed_perf = time.perf_counter()
+    def record_completion(self, at: datetime, perf_timestamp: float) -> None:
+        self.completed_at = at
+        self.completed_perf = perf_timestamp
 
     def to_dict(self) -> Dict[str, Any]:
         duration: Optional[float] = None
@@ -225,7 +225,7 @@ class SuiteMetricRecord:
         for content in contents:
             content_type = getattr(content, "type", content.__class__.__name__)
             content_types.append(content_type)
-            self._inspect_tool_content(content, perf_timestamp)
+            self._inspect_tool_content(content, received_at, perf_timestamp)
             if content_type == "usage":
                 event.setdefault("usage_details", []).append(
                     _usage_to_dict(getattr(content, "details", None))
@@ -236,6 +236,14 @@ class SuiteMetricRecord:
             event.pop("content_types", None)
         self.stream_events.append(event)
 
+    def append_updates(self, timed_updates: Iterable[tuple[AgentResponseUpdate, float]]) -> None:
+        """Record updates buffered as ``(update, perf_counter() at receipt)`` pairs."""
+        started_at = self.started_at
+        started_perf = self.started_perf
+        for update, perf_timestamp in timed_updates:
+            received_at = started_at + timedelta(seconds=perf_timestamp - started_perf)
+            self.append_update(update, received_at=received_at, perf_timestamp=perf_timestamp)
+
     def _ensure_tool_state(self, call_id: str) -> _ToolCallState:
         state = self.tool_calls.get(call_id)
         if not state:
@@ -243,10 +251,10 @@ class SuiteMetricRecord:
             self.tool_calls[call_id] = state
         return state
 
-    def _inspect_tool_content(self, content: Any, perf_timestamp: float) -> None:
+    def _inspect_tool_content(self, content: Any, received_at: datetime, perf_timestamp: float) -> None:
         if isinstance(content, MCPServerToolCallContent):
             state = self._ensure_tool_state(content.call_id)
-            state.record_start()
+            state.record_start(received_at, perf_timestamp)
             state.name = content.tool_name or state.name
             state.server_name = content.server_name or state.server_name
             state.argument_fragments.append(_safe_serialize(content.arguments))
@@ -254,7 +262,7 @@ class SuiteMetricRecord:
             state = self._ensure_tool_state(content.call_id)
             if state.started_perf is None:
                 state.started_perf = perf_timestamp
-                state.started_at = _utc_now()
+                state.started_at = received_at
             state.output_fragments.append(_safe_serialize(content.output))
             # Screenshot payload estimation
             tool_name_l = (state.name or "").lower()
@@ -266,21 +274,21 @@ class SuiteMetricRecord:
                     self.screenshot_base64_chars_total += b64_len
                 else:
                     self.screenshot_bytes_total += _estimate_bytes_from_pathlike(content.output)
-            state.record_completion()
+            state.record_completion(received_at, perf_timestamp)
         elif isinstance(content, FunctionCallContent):
             state = self._ensure_tool_state(content.call_id)
-            state.record_start()
+            state.record_start(received_at, perf_timestamp)
             state.name = content.name or state.name
             state.argument_fragments.append(_safe_serialize(content.arguments))
         elif isinstance(content, FunctionResultContent):
             state = self._ensure_tool_state(content.call_id)
             if state.started_perf is None:
                 state.started_perf = perf_timestamp
-                state.started_at = _utc_now()
+                state.started_at = received_at
             state.output_fragments.append(_safe_serialize(content.result))
             if getattr(content, "exception", None) is not None:
                 state.error = True
-            state.record_completion()
+            state.record_completion(received_at, perf_timestamp)
 
     def finalize(self) -> tuple[Dict[str, Any], Optional[UsageDetails]]:
         completed_at = _utc_now()
@@ -347,10 +355,9 @@ class AgentRunMetricsCollector:
         self._completed_suites: List[Dict[str, Any]] = []
         self._aggregate_usage: Optional[UsageDetails] = None
 
-    def start_suite(self, suite_name: Optional[str], suite_index: int) -> None:
-        if self._active_suite is not None:
-            raise RuntimeError("A suite is already active; finalize it before starting a new one.")
-        self._active_suite = SuiteMetricRecord(
+    def begin_suite(self, suite_name: Optional[str], suite_index: int) -> SuiteMetricRecord:
+        """Start a suite record that may run alongside others; pair with complete_suite."""
+        return SuiteMetricRecord(
             suite_name=suite_name,
             suite_index=suite_index,
             suite_total=self.suite_total,
@@ -358,37 +365,48 @@ class AgentRunMetricsCollector:
             started_perf=time.perf_counter(),
         )
 
-    def record_update(self, update: AgentResponseUpdate) -> None:
-        if self._active_suite is None:
-            return
-        received_at = _utc_now()
-        perf_ts = time.perf_counter()
-        self._active_suite.append_update(update, received_at=received_at, perf_timestamp=perf_ts)
+    def record_suite_update(self, suite: SuiteMetricRecord, update: AgentResponseUpdate) -> None:
+        suite.append_update(update, received_at=_utc_now(), perf_timestamp=time.perf_counter())
 
-    def finish_suite(self) -> Dict[str, Any]:
-        if self._active_suite is None:
-            raise RuntimeError("No active suite to finalize.")
-        record, usage_obj = self._active_suite.finalize()
+    def record_suite_updates(
+        self, suite: SuiteMetricRecord, timed_updates: Iterable[tuple[AgentResponseUpdate, float]]
+    ) -> None:
+        """Flush a batch of ``(update, perf_counter())`` pairs collected by the streaming loop."""
+        suite.append_updates(timed_updates)
+
+    def complete_suite(self, suite: SuiteMetricRecord, *, aborted: bool = False) -> Dict[str, Any]:
+        record, usage_obj = suite.finalize()
         if usage_obj:
             if self._aggregate_usage is None:
                 self._aggregate_usage = usage_obj
             else:
                 self._aggregate_usage += usage_obj
+        if aborted:
+            record["aborted"] = True
         self._completed_suites.append(record)
+        return record
+
+    def start_suite(self, suite_name: Optional[str], suite_index: int) -> None:
+        if self._active_suite is not None:
+            raise RuntimeError("A suite is already active; finalize it before starting a new one.")
+        self._active_suite = self.begin_suite(suite_name, suite_index)
+
+    def record_update(self, update: AgentResponseUpdate) -> None:
+        if self._active_suite is None:
+            return
+        self.record_suite_update(self._active_suite, update)
+
+    def finish_suite(self) -> Dict[str, Any]:
+        if self._active_suite is None:
+            raise RuntimeError("No active suite to finalize.")
+        record = self.complete_suite(self._active_suite)
         self._active_suite = None
         return record
 
     def abort_active_suite(self) -> Optional[Dict[str, Any]]:
         if self._active_suite is None:
             return None
-        record, usage_obj = self._active_suite.finalize()
-        if usage_obj:
-            if self._aggregate_usage is None:
-                self._aggregate_usage = usage_obj
-            else:
-                self._aggregate_usage += usage_obj
-        record["aborted"] = True
-        self._completed_suites.append(record)
+        record = self.complete_suite(self._active_suite, aborted=True)
         self._active_suite = None
         return record
 
@@ -418,7 +436,8 @@ class AgentRunMetricsCollector:
                     "estimated_input_tokens": screenshot_tokens or None,
                 },
             },
-            "suites": self._completed_suites,
+            # Suites may complete out of order when run concurrently
+            "suites": sorted(self._completed_suites, key=lambda record: record["suite_index"]),
         }
 
     @property
@@ -1,17 +1,33 @@
 import asyncio
+import hashlib
 import json
 import logging
 import os
+import random
 import re
+import time
+import weakref
+from dataclasses import dataclass, replace
 from pathlib import Path
-from typing import Annotated, Any, Dict, List, Optional
+from typing import Annotated, Any, Awaitable, Callable, Dict, List, Mapping, Optional, Tuple
 
 from agent_framework import ChatMessage, ai_function
 from agent_framework.anthropic import AnthropicClient
+import anthropic
 from anthropic import AsyncAnthropicFoundry
 from dotenv import load_dotenv
 from pydantic import Field
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from anthropic.types import TextBlock
+except ImportError:
+    TextBlock = None
+
 try:
     from .agent_debug import log_agent_response_metadata
 except ImportError:
@@ -19,24 +35,89 @@ except ImportError:
 
 load_dotenv()
 
+
+@dataclass(frozen=True, slots=True)
+class LLMConfig:
+    """Typed LLM settings, resolved once so call sites use attribute access."""
+
+    endpoint: str = ""
+    deployment: str = ""
+    api_key: str = ""
+    api_version: str = "2024-12-01-preview"
+    temperature: float = 0.15
+    max_output_tokens: int = 5000
+    max_concurrency: int = 8
+    max_retries: int = 4
+    retry_max_delay_seconds: float = 30.0
+
+    @classmethod
+    def from_mapping(cls, values: Mapping[str, Any]) -> "LLMConfig":
+        return cls(
+            endpoint=str(values.get("endpoint", "")),
+            deployment=str(values.get("deployment", "")),
+            api_key=str(values.get("api_key", "")),
+            api_version=str(values.get("api_version", "2024-12-01-preview")),
+            temperature=float(values.get("temperature", 0.15)),
+            max_output_tokens=int(values.get("max_output_tokens", values.get("max_tokens", 5000))),
+            max_concurrency=int(values.get("max_concurrency", 8)),
+            max_retries=int(values.get("max_retries", 4)),
+            retry_max_delay_seconds=float(values.get("retry_max_delay_seconds", 30.0)),
+        )
+
+
+def get_llm_config(config: Dict[str, object]) -> LLMConfig:
+    """Return ``config['llm']`` as an LLMConfig, converting a plain mapping if one was supplied."""
+    llm_config = config.get("llm")
+    if isinstance(llm_config, LLMConfig):
+        return llm_config
+    return LLMConfig.from_mapping(llm_config if isinstance(llm_config, Mapping) else {})
+
+
+WORKSPACE_ROOT = Path(__file__).resolve().parent.parent
+# Replaying earlier completions is opt-in; one switch covers both the response and plan caches
+LLM_CACHE_ENABLED = os.getenv("CODER_RESPONSE_CACHE", "0").strip().lower() in {"1", "true", "yes", "on"}
+
 AGENT_CONFIG: Dict[str, object] = {
     "output_directory": Path("artifacts"),
     "requirements_path": Path("requirements/feature-request.md"),
     "use_llm": True,
-    "llm": {
-        "endpoint": os.getenv("ANTHROPIC_FOUNDRY_ENDPOINT", ""),
-        "deployment": os.getenv("ANTHROPIC_FOUNDRY_DEPLOYMENT", ""),
-        "api_key": os.getenv("ANTHROPIC_FOUNDRY_API_KEY", ""),
-        "api_version": os.getenv("AZURE_OPENAI_API_VERSION", "2024-12-01-preview"),
-        "temperature": 0.15,
-        "max_output_tokens": 10000,
+    "llm": LLMConfig(
+        endpoint=os.getenv("ANTHROPIC_FOUNDRY_ENDPOINT", ""),
+        deployment=os.getenv("ANTHROPIC_FOUNDRY_DEPLOYMENT", ""),
+        api_key=os.getenv("ANTHROPIC_FOUNDRY_API_KEY", ""),
+        api_version=os.getenv("AZURE_OPENAI_API_VERSION", "2024-12-01-preview"),
+        temperature=0.15,
+        max_output_tokens=10000,
+        max_concurrency=int(os.getenv("CODER_MAX_CONCURRENCY", "8")),
+        max_retries=4,
+        retry_max_delay_seconds=30.0,
+    ),
+    "response_cache": {
+        "enabled": LLM_CACHE_ENABLED,
+        "directory": WORKSPACE_ROOT / "artifacts" / ".llm-cache",
+        "ttl_seconds": 86400,
+        "max_temperature": 0.3,
+    },
+    "plan_cache": {
+        "enabled": LLM_CACHE_ENABLED,
+        "directory": WORKSPACE_ROOT / "artifacts" / ".plan-cache",
+        "ttl_seconds": 86400,
+    },
+    "bulk_generation": {
+        "enabled": os.getenv("CODER_BULK_GENERATION", "0").strip().lower() in {"1", "true", "yes", "on"},
+        "max_pages": 2,
+        "max_context_chars": 12000,
     },
 }
 
 LOGGER = logging.getLogger("frontend_coder_agent")
 
-WORKSPACE_ROOT = Path(__file__).resolve().parent.parent
 _GLOBAL_CLASS_LIST: List[str] = []
+# One semaphore per event loop; a semaphore bound to a finished loop cannot be awaited from another
+_LLM_SEMAPHORES: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore] = weakref.WeakKeyDictionary()
+_JSON_DECODER = json.JSONDecoder()
+_BRAND_HEADING_PATTERN = re.compile(r"^#\s*(.+)$", re.MULTILINE)
+_SLUG_SEPARATOR_PATTERN = re.compile(r"[^a-zA-Z0-9]+")
 
 
 def resolve_workspace_path(relative_path: str) -> Path:
@@ -109,7 +190,7 @@ def trim_text(value: str, limit: int = 5000) -> str:
 
 
 def extract_metadata(markdown_text: str) -> Dict[str, str]:
-    brand_match = re.search(r"^#\s*(.+)$", markdown_text, flags=re.MULTILINE)
+    brand_match = _BRAND_HEADING_PATTERN.search(markdown_text)
     brand_name = brand_match.group(1).strip() if brand_match else "Digital Experience"
     body_lines: List[str] = []
     for line in markdown_text.splitlines():
@@ -128,15 +209,14 @@ def extract_metadata(markdown_text: str) -> Dict[str, str]:
 
 
 def slugify(value: str) -> str:
-    lower = re.sub(r"[^a-zA-Z0-9]+", "-", value).strip("-")
-    return lower.lower() or "site"
+    return _SLUG_SEPARATOR_PATTERN.sub("-", value).strip("-").lower() or "site"
 
 
 def build_llm_client(config: Dict[str, object]) -> AnthropicClient:
-    llm_config = config.get("llm", {}) if isinstance(config.get("llm"), dict) else {}
-    endpoint = llm_config.get("endpoint", "")
-    deployment = llm_config.get("deployment", "")
-    api_key = llm_config.get("api_key", "")
+    llm_config = get_llm_config(config)
+    endpoint = llm_config.endpoint
+    deployment = llm_config.deployment
+    api_key = llm_config.api_key
 
     if not endpoint or not deployment or not api_key:
         raise RuntimeError("Anthropic Foundry configuration is incomplete. Please set endpoint, deployment, and api key.")
@@ -163,6 +243,12 @@ def extract_text_from_response(response: Any) -> Optional[str]:
 
     content = getattr(response, "content", None)
     if isinstance(content, list):
+        if TextBlock is not None:
+            # Raw SDK messages carry typed blocks; join them without the reflective walk below.
+            text_block = TextBlock
+            typed_text = "".join(block.text for block in content if isinstance(block, text_block))
+            if typed_text:
+                return typed_text.strip()
         fragments: List[str] = []
         for item in content:
             if isinstance(item, dict):
@@ -208,18 +294,117 @@ def extract_text_from_response(response: Any) -> Optional[str]:
     return None
 
 
+def is_retryable_llm_error(exc: BaseException) -> bool:
+    """True for rate limits, timeouts, connection drops and 5xx, including when wrapped by agent_framework."""
+    current: Optional[BaseException] = exc
+    for _ in range(5):
+        if current is None:
+            break
+        if isinstance(current, (anthropic.RateLimitError, anthropic.APIConnectionError)):
+            return True
+        if isinstance(current, anthropic.APIStatusError):
+            return current.status_code >= 500 or current.status_code in {408, 409, 429}
+        current = current.__cause__ or current.__context__
+    return False
+
+
+def get_llm_semaphore(config: Dict[str, object]) -> asyncio.Semaphore:
+    """Return the semaphore bounding concurrent LLM calls on the running loop, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    semaphore = _LLM_SEMAPHORES.get(loop)
+    if semaphore is None:
+        semaphore = _LLM_SEMAPHORES[loop] = asyncio.Semaphore(max(get_llm_config(config).max_concurrency, 1))
+    return semaphore
+
+
+def build_response_cache_key(
+    deployment: str,
+    system_prompt: str,
+    user_prompt: str,
+    temperature: float,
+    max_tokens: int,
+) -> str:
+    hasher = hashlib.sha256()
+    for part in (deployment, f"{temperature:.4f}", str(max_tokens), system_prompt, user_prompt):
+        hasher.update(part.encode("utf-8"))
+        hasher.update(b"\x00")
+    return hasher.hexdigest()
+
+
+def response_cache_dir(config: Dict[str, object], temperature: float) -> Optional[Path]:
+    """Return the response cache directory, or None when caching does not apply."""
+    cache_config = config.get("response_cache", {}) if isinstance(config.get("response_cache"), dict) else {}
+    if not cache_config.get("enabled", False):
+        return None
+    # Sampled completions are meant to vary; only cache near-deterministic calls.
+    if temperature > float(cache_config.get("max_temperature", 0.3)):
+        return None
+    return Path(cache_config.get("directory", WORKSPACE_ROOT / "artifacts" / ".llm-cache"))
+
+
+def read_cached_completion(cache_path: Path, ttl_seconds: float) -> Optional[str]:
+    try:
+        if time.time() - cache_path.stat().st_mtime > ttl_seconds:
+            return None
+        payload = json.loads(cache_path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    completion = payload.get("completion") if isinstance(payload, dict) else None
+    return completion if isinstance(completion, str) and completion else None
+
+
+def write_cached_completion(cache_path: Path, completion: str) -> None:
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        cache_path.write_text(json.dumps({"completion": completion}), encoding="utf-8")
+    except OSError as exc:
+        LOGGER.warning("Could not write LLM response cache %s: %s", cache_path, exc)
+
+
+def is_truncated_response(response: Any) -> bool:
+    """True when the model stopped at the output token limit rather than finishing."""
+    finish_reason = getattr(response, "finish_reason", None)
+    return str(getattr(finish_reason, "value", finish_reason)).lower() in {"length", "max_tokens"}
+
+
+def to_pretty_json(value: Any) -> str:
+    """Indented JSON for prompts, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2).decode("utf-8")
+    # Match orjson's raw UTF-8 so prompts and cache keys don't depend on which one is installed
+    return json.dumps(value, indent=2, ensure_ascii=False)
+
+
+def loads_json_payload(text: str) -> Any:
+    """Parse JSON, tolerating stray prose before the first object or after it ends."""
+    try:
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers need one handler.
+        return orjson.loads(text) if orjson is not None else json.loads(text)
+    except json.JSONDecodeError:
+        start = text.find("{")
+        if start < 0:
+            raise
+        payload, _ = _JSON_DECODER.raw_decode(text, start)
+        return payload
+
+
 def clean_llm_completion(text: str) -> str:
     stripped = text.strip()
-    if stripped.startswith("```"):
-        lines = stripped.splitlines()
-        if len(lines) >= 2:
-            fence = lines[0]
-            if fence.startswith("```"):
-                lines = lines[1:]
-                if lines and lines[-1].strip().startswith("```"):
-                    lines = lines[:-1]
-                return "\n".join(lines).strip()
-    return stripped
+    if not stripped.startswith("```"):
+        return stripped
+    # Slice the fences off in place rather than splitting the whole completion into lines.
+    first_newline = stripped.find("\n")
+    if first_newline < 0:
+        return stripped
+    body = stripped[first_newline + 1:]
+    last_newline = body.rfind("\n")
+    if body[last_newline + 1:].strip().startswith("```"):
+        body = body[:max(last_newline, 0)]
+    return body.strip()
+
+
+def has_content(completion: str) -> bool:
+    return bool(clean_llm_completion(completion))
 
 
 async def invoke_llm_chat(
@@ -228,26 +413,56 @@ async def invoke_llm_chat(
     system_prompt: str,
     user_prompt: str,
     config: Dict[str, object],
+    cache_if: Optional[Callable[[str], bool]] = None,
 ) -> Optional[str]:
+    """Run one chat turn; a completion is cached only when ``cache_if`` accepts it."""
     if agent is None:
         return None
 
-    llm_config = config.get("llm", {}) if isinstance(config.get("llm"), dict) else {}
-    temperature = float(llm_config.get("temperature", 0.15))
-    max_tokens = int(llm_config.get("max_output_tokens", llm_config.get("max_tokens", 5000)))
+    llm_config = get_llm_config(config)
+    temperature = llm_config.temperature
+    max_tokens = llm_config.max_output_tokens
 
-    try:
-        response = await agent.run(
-            [
-                ChatMessage(role="system", text=system_prompt),
-                ChatMessage(role="user", text=user_prompt),
-            ],
-            temperature=temperature,
-            max_tokens=max_tokens,
+    cache_path: Optional[Path] = None
+    cache_dir = response_cache_dir(config, temperature) if cache_if is not None else None
+    if cache_dir is not None:
+        # Hash the prompts only when a cached reply could actually be used
+        cache_key = build_response_cache_key(
+            llm_config.deployment, system_prompt, user_prompt, temperature, max_tokens
         )
-    except Exception as exc:
-        LOGGER.error("LLM call failed: %s", exc)
-        return None
+        cache_path = cache_dir / f"{cache_key}.json"
+        cache_config = config.get("response_cache", {}) if isinstance(config.get("response_cache"), dict) else {}
+        cached = read_cached_completion(cache_path, float(cache_config.get("ttl_seconds", 86400)))
+        if cached is not None:
+            LOGGER.info("LLM response cache hit %s", cache_key[:12])
+            return cached
+
+    messages = [
+        ChatMessage(role="system", text=system_prompt),
+        ChatMessage(role="user", text=user_prompt),
+    ]
+
+    max_retries = llm_config.max_retries
+    max_delay = llm_config.retry_max_delay_seconds
+    attempt = 0
+    while True:
+        try:
+            async with get_llm_semaphore(config):
+                response = await agent.run(
+                    messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                )
+            break
+        except Exception as exc:
+            if attempt >= max_retries or not is_retryable_llm_error(exc):
+                LOGGER.error("LLM call failed: %s", exc)
+                return None
+            # Full jitter keeps concurrent callers from retrying in lockstep.
+            delay = random.uniform(0, min(max_delay, 2.0 ** attempt))
+            attempt += 1
+            LOGGER.warning("LLM call failed (%s); retry %d/%d in %.1fs.", exc, attempt, max_retries, delay)
+            await asyncio.sleep(delay)
 
     log_agent_response_metadata(
         "CoderAgent",
@@ -256,43 +471,54 @@ async def invoke_llm_chat(
         include_message_count=True,
     )
 
-    return extract_text_from_response(response)
+    completion = extract_text_from_response(response)
+    if (
+        completion
+        and cache_path is not None
+        and not is_truncated_response(response)
+        and cache_if(completion)
+    ):
+        write_cached_completion(cache_path, completion)
+    return completion
+
+
+SITE_PLAN_SCHEMA: Dict[str, Any] = {
+    "project_name": "Human readable name",
+    "project_slug": "kebab-case identifier",
+    "pages": [
+        {
+            "filename": "index.html",
+            "display_name": "Home",
+            "purpose": "Why this page exists",
+            "key_sections": ["Hero", "Highlights"],
+            "interactive_targets": ["accordion"]
+        }
+    ],
+    "assets": {
+        "css": [
+            {
+                "filename": "styles.css",
+                "scope": "global",
+                "notes": "Shared layout, modern styling"
+            }
+        ],
+        "js": [
+            {
+                "filename": "script.js",
+                "scope": "global",
+                "notes": "Progressive enhancement behaviors"
+            }
+        ]
+    },
+    "testing_focus": ["data-testid hooks that must exist"]
+}
+SITE_PLAN_SCHEMA_JSON = json.dumps(SITE_PLAN_SCHEMA, indent=2)
 
 
 def build_site_plan_prompt(requirements_text: str, metadata: Dict[str, str]) -> Dict[str, str]:
     system_prompt = (
         "You are a senior web architect. Respond only with strict JSON."
     )
-    schema = {
-        "project_name": "Human readable name",
-        "project_slug": "kebab-case identifier",
-        "pages": [
-            {
-                "filename": "index.html",
-                "display_name": "Home",
-                "purpose": "Why this page exists",
-                "key_sections": ["Hero", "Highlights"],
-                "interactive_targets": ["accordion"]
-            }
-        ],
-        "assets": {
-            "css": [
-                {
-                    "filename": "styles.css",
-                    "scope": "global",
-                    "notes": "Shared layout, modern styling"
-                }
-            ],
-            "js": [
-                {
-                    "filename": "script.js",
-                    "scope": "global",
-                    "notes": "Progressive enhancement behaviors"
-                }
-            ]
-        },
-        "testing_focus": ["data-testid hooks that must exist"]
-    }
     user_prompt = (
         "Design a static website plan for the brand '{brand}'.\n"
         "Requirements excerpt:\n{requirements}\n\n"
@@ -304,7 +530,7 @@ def build_site_plan_prompt(requirements_text: str, metadata: Dict[str, str]) ->
     ).format(
         brand=metadata.get("brand_name", "the brand"),
         requirements=metadata.get("requirements_excerpt", ""),
-        schema=json.dumps(schema, indent=2),
+        schema=SITE_PLAN_SCHEMA_JSON,
     )
     return {"system": system_prompt, "user": user_prompt}
 
@@ -335,6 +561,7 @@ def normalize_site_plan(plan: Dict[str, Any], metadata: Dict[str, str], config:
     pages = plan.get("pages") if isinstance(plan.get("pages"), list) else []
     normalized_pages: List[Dict[str, Any]] = []
     used_filenames: set[str] = set()
+    next_suffix: Dict[str, int] = {}
 
     if not pages:
         pages = [
@@ -356,10 +583,14 @@ def normalize_site_plan(plan: Dict[str, Any], metadata: Dict[str, str], config:
         if not filename.endswith(".html"):
             filename = f"{slugify(filename)}.html"
         base = filename.rsplit(".html", 1)[0]
-        counter = 2
-        while filename.lower() in used_filenames:
+        if filename.lower() in used_filenames:
+            # Resume from the last suffix handed out for this base instead of rescanning from 2.
+            base_key = base.lower()
+            counter = next_suffix.get(base_key, 2)
+            while f"{base_key}-{counter}.html" in used_filenames:
+                counter += 1
             filename = f"{base}-{counter}.html"
-            counter += 1
+            next_suffix[base_key] = counter + 1
         used_filenames.add(filename.lower())
         normalized_pages.append(
             {
@@ -404,6 +635,22 @@ def extract_classes_from_html(html: str) -> List[str]:
     return sorted(classes)
 
 
+def plan_cache_path(prompts: Dict[str, str], config: Dict[str, object]) -> Optional[Path]:
+    """Cache file for a plan, keyed on the planning prompts and the model settings."""
+    cache_config = config.get("plan_cache", {}) if isinstance(config.get("plan_cache"), dict) else {}
+    if not cache_config.get("enabled", False):
+        return None
+    llm_config = get_llm_config(config)
+    key = build_response_cache_key(
+        llm_config.deployment,
+        prompts["system"],
+        prompts["user"],
+        llm_config.temperature,
+        llm_config.max_output_tokens,
+    )
+    return Path(cache_config.get("directory", WORKSPACE_ROOT / "artifacts" / ".plan-cache")) / f"{key}.json"
+
+
 async def generate_site_plan(
     requirements_text: str,
     metadata: Dict[str, str],
@@ -412,10 +659,24 @@ async def generate_site_plan(
 ) -> Dict[str, Any]:
     if not config.get("use_llm", True):
         raise RuntimeError("LLM usage disabled while generating the site plan.")
+
+    prompts = build_site_plan_prompt(requirements_text, metadata)
+    cache_path = plan_cache_path(prompts, config)
+    if cache_path is not None:
+        cache_config = config.get("plan_cache", {}) if isinstance(config.get("plan_cache"), dict) else {}
+        cached = read_cached_completion(cache_path, float(cache_config.get("ttl_seconds", 86400)))
+        if cached is not None:
+            try:
+                plan = loads_json_payload(cached)
+            except json.JSONDecodeError:
+                plan = None
+            if isinstance(plan, dict):
+                LOGGER.info("Loaded site plan from cache %s", cache_path)
+                return normalize_site_plan(plan, metadata, config)
+
     if agent is None:
         raise RuntimeError("LLM client not initialized. Cannot generate the site plan.")
 
-    prompts = build_site_plan_prompt(requirements_text, metadata)
     completion = await invoke_llm_chat(
         agent,
         system_prompt=prompts["system"],
@@ -427,11 +688,14 @@ async def generate_site_plan(
 
     cleaned = clean_llm_completion(completion)
     try:
-        plan = json.loads(cleaned)
+        plan = loads_json_payload(cleaned)
     except json.JSONDecodeError as exc:
         LOGGER.error("Failed to parse site plan JSON: %s", exc)
         raise RuntimeError("Invalid site plan JSON returned by LLM.") from exc
 
+    if cache_path is not None and isinstance(plan, dict):
+        # Store the raw plan; normalization depends on config such as the output directory.
+        write_cached_completion(cache_path, cleaned)
     return normalize_site_plan(plan, metadata, config)
 
 
@@ -441,22 +705,25 @@ def ensure_project_structure(plan: Dict[str, Any]) -> None:
     LOGGER.info("Ensured project directory %s", base_path)
 
 
-def build_html_prompt(
-    page_spec: Dict[str, Any],
-    plan: Dict[str, Any],
-    metadata: Dict[str, str],
-    requirements_text: str,
-) -> Dict[str, str]:
-    system_prompt = "You craft semantic, accessible HTML5. Return a complete document."
-    plan_snapshot = json.dumps(
+def build_plan_snapshot(plan: Dict[str, Any]) -> str:
+    return to_pretty_json(
         {
             "project_name": plan["project_name"],
             "pages": plan["pages"],
             "assets": plan["assets"],
             "testing_focus": plan.get("testing_focus", []),
-        },
-        indent=2,
+        }
     )
+
+
+def build_html_prompt(
+    page_spec: Dict[str, Any],
+    plan: Dict[str, Any],
+    metadata: Dict[str, str],
+    requirements_excerpt: str,
+    plan_snapshot: Optional[str] = None,
+) -> Dict[str, str]:
+    system_prompt = "You craft semantic, accessible HTML5. Return a complete document."
     user_prompt = (
         "Build the '{display}' page for {brand}.\n"
         "Page specification:\n{page_spec}\n\n"
@@ -470,14 +737,18 @@ def build_html_prompt(
     ).format(
         display=page_spec.get("display_name"),
         brand=metadata.get("brand_name", "the brand"),
-        page_spec=json.dumps(page_spec, indent=2),
-        plan_snapshot=plan_snapshot,
-        requirements=trim_text(requirements_text),
+        page_spec=to_pretty_json(page_spec),
+        plan_snapshot=plan_snapshot or build_plan_snapshot(plan),
+        requirements=requirements_excerpt,
     )
     return {"system": system_prompt, "user": user_prompt}
 
 
-def build_styles_prompt(plan: Dict[str, Any], metadata: Dict[str, str], requirements_text: str) -> Dict[str, str]:
+def build_styles_prompt(
+    plan: Dict[str, Any],
+    metadata: Dict[str, str],
+    requirements_excerpt: str,
+) -> Dict[str, str]:
     system_prompt = "You author modern, responsive CSS. Return only CSS."
     user_prompt = (
         "Create a single stylesheet '{filename}' for {brand}.\n"
@@ -494,14 +765,18 @@ def build_styles_prompt(plan: Dict[str, Any], metadata: Dict[str, str], requirem
     ).format(
         filename=plan["assets"]["css"][0]["filename"],
         brand=metadata.get("brand_name", "the brand"),
-        plan_snapshot=json.dumps({"pages": plan["pages"], "testing_focus": plan.get("testing_focus", [])}, indent=2),
-        requirements=trim_text(requirements_text),
-        class_list=json.dumps(sorted(_GLOBAL_CLASS_LIST or []), indent=2),
+        plan_snapshot=to_pretty_json({"pages": plan["pages"], "testing_focus": plan.get("testing_focus", [])}),
+        requirements=requirements_excerpt,
+        class_list=to_pretty_json(sorted(_GLOBAL_CLASS_LIST or [])),
     )
     return {"system": system_prompt, "user": user_prompt}
 
 
-def build_script_prompt(plan: Dict[str, Any], metadata: Dict[str, str], requirements_text: str) -> Dict[str, str]:
+def build_script_prompt(
+    plan: Dict[str, Any],
+    metadata: Dict[str, str],
+    requirements_excerpt: str,
+) -> Dict[str, str]:
     system_prompt = "You write defensive, framework-free JavaScript. Return only JS."
     interactive_targets: List[str] = []
     for page in plan["pages"]:
@@ -523,25 +798,121 @@ def build_script_prompt(plan: Dict[str, Any], metadata: Dict[str, str], requirem
         brand=metadata.get("brand_name", "the brand"),
         interactive=", ".join(sorted(set(interactive_targets))),
         testing=", ".join(plan.get("testing_focus", [])),
-        requirements=trim_text(requirements_text),
+        requirements=requirements_excerpt,
+    )
+    return {"system": system_prompt, "user": user_prompt}
+
+
+def build_bulk_generation_prompt(
+    plan: Dict[str, Any],
+    metadata: Dict[str, str],
+    requirements_excerpt: str,
+    plan_snapshot: str,
+) -> Dict[str, str]:
+    system_prompt = (
+        "You build complete static sites: semantic, accessible HTML5, modern responsive CSS, and "
+        "defensive framework-free JavaScript. Respond only with strict JSON."
+    )
+    filenames = [page["filename"] for page in plan["pages"]]
+    filenames += [plan["assets"]["css"][0]["filename"], plan["assets"]["js"][0]["filename"]]
+    user_prompt = (
+        "Build every file of the {brand} site.\n"
+        "Project plan snapshot:\n{plan_snapshot}\n\n"
+        "Full requirements excerpt:\n{requirements}\n\n"
+        "Return one JSON object whose keys are exactly these filenames and whose values are the full file contents:\n"
+        "{filenames}\n\n"
+        "Constraints:\n"
+        "- Every page links to './{css}' and './{js}'.\n"
+        "- Include data-testid attributes for navigation, primary CTAs, and interactive elements; "
+        "the main element uses data-testid='main-content'.\n"
+        "- The stylesheet covers reset, layout, components, focus styles, dark theme via [data-theme='dark'], "
+        "and 768px/1200px breakpoints for every class the pages use.\n"
+        "- The script attaches behavior through data-testid selectors, guards against missing DOM nodes, "
+        "and uses no external dependencies.\n"
+        "Respond with JSON only."
+    ).format(
+        brand=metadata.get("brand_name", "the brand"),
+        plan_snapshot=plan_snapshot,
+        requirements=requirements_excerpt,
+        filenames=to_pretty_json(filenames),
+        css=plan["assets"]["css"][0]["filename"],
+        js=plan["assets"]["js"][0]["filename"],
     )
     return {"system": system_prompt, "user": user_prompt}
 
 
+def bulk_generation_applies(
+    plan: Dict[str, Any], requirements_excerpt: str, plan_snapshot: str, config: Dict[str, object]
+) -> bool:
+    """Small sites fit in one response; larger ones would run past the output token budget."""
+    bulk_config = config.get("bulk_generation", {}) if isinstance(config.get("bulk_generation"), dict) else {}
+    if not bulk_config.get("enabled", False):
+        return False
+    if len(plan["pages"]) > int(bulk_config.get("max_pages", 2)):
+        return False
+    return len(requirements_excerpt) + len(plan_snapshot) <= int(bulk_config.get("max_context_chars", 12000))
+
+
+def parse_bulk_files(completion: str, expected: List[str]) -> Optional[Dict[str, str]]:
+    """Map each expected filename to its content, or None if the reply is not valid JSON or misses a file."""
+    try:
+        payload = loads_json_payload(clean_llm_completion(completion))
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    files: Dict[str, str] = {}
+    for filename in expected:
+        content = payload.get(filename)
+        if not isinstance(content, str) or not content.strip():
+            return None
+        files[filename] = clean_llm_completion(content)
+    return files
+
+
+async def generate_site_bulk(
+    plan: Dict[str, Any],
+    metadata: Dict[str, str],
+    requirements_excerpt: str,
+    plan_snapshot: str,
+    config: Dict[str, object],
+    agent: Optional[Any],
+) -> Optional[Dict[str, str]]:
+    """Generate all files in a single call; returns None so the caller can fall back per file."""
+    prompts = build_bulk_generation_prompt(plan, metadata, requirements_excerpt, plan_snapshot)
+    expected = [page["filename"] for page in plan["pages"]]
+    expected += [plan["assets"]["css"][0]["filename"], plan["assets"]["js"][0]["filename"]]
+    completion = await invoke_llm_chat(
+        agent,
+        system_prompt=prompts["system"],
+        user_prompt=prompts["user"],
+        config=config,
+        cache_if=lambda text: parse_bulk_files(text, expected) is not None,
+    )
+    if not completion:
+        return None
+    files = parse_bulk_files(completion, expected)
+    if files is None:
+        LOGGER.warning("Bulk generation returned unusable JSON, falling back to per-file prompts.")
+    return files
+
+
 async def generate_html_page(
     page_spec: Dict[str, Any],
     plan: Dict[str, Any],
     metadata: Dict[str, str],
-    requirements_text: str,
+    requirements_excerpt: str,
     config: Dict[str, object],
     agent: Optional[Any],
+    plan_snapshot: Optional[str] = None,
 ) -> str:
-    prompts = build_html_prompt(page_spec, plan, metadata, requirements_text)
+    prompts = build_html_prompt(page_spec, plan, metadata, requirements_excerpt, plan_snapshot)
     completion = await invoke_llm_chat(
         agent,
         system_prompt=prompts["system"],
         user_prompt=prompts["user"],
         config=config,
+        cache_if=has_content,
     )
     if not completion:
         raise RuntimeError(f"LLM returned no HTML for page '{page_spec.get('filename')}'.")
@@ -551,43 +922,45 @@ async def generate_html_page(
 async def generate_stylesheet(
     plan: Dict[str, Any],
     metadata: Dict[str, str],
-    requirements_text: str,
+    requirements_excerpt: str,
     config: Dict[str, object],
     agent: Optional[Any],
 ) -> str:
-    llm_cfg = config.get("llm", {}) if isinstance(config.get("llm"), dict) else {}
+    llm_cfg = get_llm_config(config)
     boosted_cfg = {
         **config,
-        "llm": {**llm_cfg, "max_output_tokens": max(int(llm_cfg.get("max_output_tokens", 1500)) * 2, 10000)},
+        "llm": replace(llm_cfg, max_output_tokens=max(llm_cfg.max_output_tokens * 2, 10000)),
     }
 
-    parts: List[str] = []
+    class_list = to_pretty_json(sorted(_GLOBAL_CLASS_LIST or []))
 
     p1 = (
         "Write CSS sections: (1) Reset + Base Typography, (2) Layout Utilities (container, grid, spacing). "
         "Use design tokens and class list:\n{classes}"
-    ).format(classes=json.dumps(sorted(_GLOBAL_CLASS_LIST or []), indent=2))
-    r1 = await invoke_llm_chat(agent, system_prompt="Return only CSS.", user_prompt=p1, config=boosted_cfg)
-    if r1:
-        parts.append(clean_llm_completion(r1))
+    ).format(classes=class_list)
 
     p2 = (
         "Write CSS for components: navbar, hero, buttons (.btn, .btn-primary, .btn-secondary), cards (.intro-card, .service-card), "
         "toast (.toast, .toast-container), skip-link (.skip-link), theme-toggle (.theme-toggle). Include hover/focus/active states. "
         "Class list:\n{classes}"
-    ).format(classes=json.dumps(sorted(_GLOBAL_CLASS_LIST or []), indent=2))
-    r2 = await invoke_llm_chat(agent, system_prompt="Return only CSS.", user_prompt=p2, config=boosted_cfg)
-    if r2:
-        parts.append(clean_llm_completion(r2))
+    ).format(classes=class_list)
 
     # Pass 3: Accessibility + Dark theme + Media queries
     p3 = (
         "Add accessibility styles (focus-visible outlines, reduced motion hooks), dark theme overrides under [data-theme='dark'], "
         "and responsive media queries for 768px and 1200px breakpoints covering layout and components."
     )
-    r3 = await invoke_llm_chat(agent, system_prompt="Return only CSS.", user_prompt=p3, config=boosted_cfg)
-    if r3:
-        parts.append(clean_llm_completion(r3))
+
+    # The passes are independent prompts, so issue them together and keep section order.
+    responses = await asyncio.gather(
+        *(
+            invoke_llm_chat(
+                agent, system_prompt="Return only CSS.", user_prompt=prompt, config=boosted_cfg, cache_if=has_content
+            )
+            for prompt in (p1, p2, p3)
+        )
+    )
+    parts: List[str] = [clean_llm_completion(response) for response in responses if response]
 
     css_combined = "\n\n".join([p for p in parts if p.strip()])
     if not css_combined.strip():
@@ -598,16 +971,17 @@ async def generate_stylesheet(
 async def generate_script(
     plan: Dict[str, Any],
     metadata: Dict[str, str],
-    requirements_text: str,
+    requirements_excerpt: str,
     config: Dict[str, object],
     agent: Optional[Any],
 ) -> str:
-    prompts = build_script_prompt(plan, metadata, requirements_text)
+    prompts = build_script_prompt(plan, metadata, requirements_excerpt)
     completion = await invoke_llm_chat(
         agent,
         system_prompt=prompts["system"],
         user_prompt=prompts["user"],
         config=config,
+        cache_if=has_content,
     )
     if not completion:
         raise RuntimeError("LLM returned no JavaScript output.")
@@ -620,38 +994,92 @@ async def generate_site_artifacts(
     requirements_text: str,
     config: Dict[str, object],
     agent: Optional[Any],
+    artifact_queue: Optional["asyncio.Queue[Optional[Tuple[str, str]]]"] = None,
 ) -> Dict[str, str]:
-    artifacts: Dict[str, str] = {}
+    """Generate every planned file.
+
+    With ``artifact_queue`` each file is handed to the writer as soon as it is ready and is
+    not retained in the returned mapping; otherwise the mapping holds every path and content.
+    """
+    global _GLOBAL_CLASS_LIST
     base_path = Path(plan["base_path"])
     css_filename = plan["assets"]["css"][0]["filename"]
     js_filename = plan["assets"]["js"][0]["filename"]
     collected_classes: set[str] = set()
+    # Trim once here; the prompt builders expect the excerpt rather than the full text.
+    requirements_excerpt = metadata.get("requirements_excerpt") or trim_text(requirements_text)
+    # The plan snapshot is identical for every file, so serialize it a single time.
+    plan_snapshot = build_plan_snapshot(plan)
 
-    for page in plan["pages"]:
-        html = await generate_html_page(page, plan, metadata, requirements_text, config, agent)
-        # Record classes for styling prompt
-        for cls in extract_classes_from_html(html):
-            collected_classes.add(cls)
-        artifacts[str(base_path / page["filename"])] = html
+    artifacts: Dict[str, str] = {}
+    if artifact_queue is None:
+        # Pre-seed keys so the mapping keeps plan order regardless of completion order.
+        filenames = [page["filename"] for page in plan["pages"]] + [css_filename, js_filename]
+        artifacts = dict.fromkeys((str(base_path / filename) for filename in filenames), "")
+
+    def publish_content(filename: str, content: str) -> None:
+        if filename.endswith(".html"):
+            # Record classes for styling prompt
+            collected_classes.update(extract_classes_from_html(content))
+        path = str(base_path / filename)
+        if artifact_queue is not None:
+            # The writer owns the content from here; keeping a copy would hold every file in memory.
+            artifact_queue.put_nowait((path, content))
+        else:
+            artifacts[path] = content
+
+    async def publish(filename: str, pending: Awaitable[str]) -> None:
+        publish_content(filename, await pending)
+
+    if bulk_generation_applies(plan, requirements_excerpt, plan_snapshot, config):
+        bulk_files = await generate_site_bulk(plan, metadata, requirements_excerpt, plan_snapshot, config, agent)
+        if bulk_files is not None:
+            for filename, content in bulk_files.items():
+                publish_content(filename, content)
+            _GLOBAL_CLASS_LIST = sorted(collected_classes)
+            return artifacts
+
+    # Pages and the script do not depend on each other, so run them concurrently.
+    file_tasks = [
+        asyncio.create_task(
+            publish(
+                page["filename"],
+                generate_html_page(page, plan, metadata, requirements_excerpt, config, agent, plan_snapshot),
+            )
+        )
+        for page in plan["pages"]
+    ]
+    file_tasks.append(
+        asyncio.create_task(publish(js_filename, generate_script(plan, metadata, requirements_excerpt, config, agent)))
+    )
+    try:
+        await asyncio.gather(*file_tasks)
+    except BaseException:
+        # Stop the remaining calls before the caller closes the agent and the writer queue
+        for task in file_tasks:
+            task.cancel()
+        await asyncio.gather(*file_tasks, return_exceptions=True)
+        raise
 
     # Update global class list for styles prompt
-    global _GLOBAL_CLASS_LIST
     _GLOBAL_CLASS_LIST = sorted(collected_classes)
 
-    css_content = await generate_stylesheet(plan, metadata, requirements_text, config, agent)
-    artifacts[str(base_path / css_filename)] = css_content
-    js_content = await generate_script(plan, metadata, requirements_text, config, agent)
-    artifacts[str(base_path / js_filename)] = js_content
+    await publish(css_filename, generate_stylesheet(plan, metadata, requirements_excerpt, config, agent))
 
     return artifacts
 
 
-def write_generated_files(artifacts: Dict[str, str]) -> List[str]:
+async def write_queued_files(artifact_queue: "asyncio.Queue[Optional[Tuple[str, str]]]") -> List[str]:
+    """Write artifacts as they arrive on the queue until a ``None`` sentinel is received."""
     written: List[str] = []
-    for raw_path, content in artifacts.items():
+    while True:
+        item = await artifact_queue.get()
+        if item is None:
+            break
+        raw_path, content = item
         path = Path(raw_path)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(content, encoding="utf-8")
+        await asyncio.to_thread(path.write_text, content, encoding="utf-8")
         written.append(str(path))
         LOGGER.info("Wrote %s", path)
     return written
@@ -673,12 +1101,19 @@ async def main() -> None:
     ) as agent:
         site_plan = await generate_site_plan(requirements_text, metadata, AGENT_CONFIG, agent)
         ensure_project_structure(site_plan)
-        artifacts = await generate_site_artifacts(site_plan, metadata, requirements_text, AGENT_CONFIG, agent)
-    written_paths = write_generated_files(artifacts)
-    print(json.dumps({
+        # Write each file while the remaining ones are still being generated.
+        artifact_queue: "asyncio.Queue[Optional[Tuple[str, str]]]" = asyncio.Queue()
+        writer = asyncio.create_task(write_queued_files(artifact_queue))
+        try:
+            await generate_site_artifacts(site_plan, metadata, requirements_text, AGENT_CONFIG, agent, artifact_queue)
+        finally:
+            artifact_queue.put_nowait(None)
+            # Let files generated before a failure reach disk, and surface writer errors.
+            written_paths = await writer
+    print(to_pretty_json({
         "project_plan": site_plan,
         "generated_files": written_paths,
-    }, indent=2))
+    }))
 
 
 if __name__ == "__main__":
@@ -1,8 +1,16 @@
 import os
 import re
 import json
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, Iterable, List, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 SERVERS = [
@@ -10,33 +18,52 @@ SERVERS = [
     ("selenium_mcp", "Selenium MCP"),
     ("selenium_server1", "Selenium Server1"),
 ]
-
-
-def read_text(path: str) -> str:
-    with open(path, "r", encoding="utf-8", errors="ignore") as f:
-        return f.read()
-
-
-def split_blocks_by_scenarios(text: str):
-    lines = text.splitlines()
+_SERVER_LABELS: Dict[str, str] = dict(SERVERS)
+
+# Allow one or more heading hashes (e.g., #, ##, ###) before 'Suite N: Title'
+_SUITE_HEADING_RE = re.compile(r"^#+\s*Suite\s*(\d+)\s*:\s*(.+)")
+# Match variations like `## **Scenario 1.1: Title**`, `## Scenario 1.1: Title`, or `### **Scenario 4.1` etc.
+_SCENARIO_HEADING_RE = re.compile(r"^\s*(?:#+|)\s*\*{0,2}\s*Scenario\s+(\d+\.\d+)\s*:\s*(.+)")
+_SUITE_NUM_RE = re.compile(r"Suite\s+(\d+)")
+_STATUS_LINE_RE = re.compile(r"\b(Result|Results|Status)\b", re.IGNORECASE)
+# Status probes in priority order: (status, emoji marker, upper-case literal, word regex).
+# Each word regex starts with a literal so it is only run to confirm a literal hit.
+_STATUS_PROBES = (
+    ("FAIL", "❌", "FAIL", re.compile(r"\bFAIL\b", re.IGNORECASE)),
+    ("PARTIAL", "⚠️", "PARTIAL", re.compile(r"\bPARTIAL\b", re.IGNORECASE)),
+    ("PASS", "✅", "PASS", re.compile(r"\bPASS\b", re.IGNORECASE)),
+)
+# Note-line prefixes keyed by their first character, so most lines are rejected in one lookup
+_NOTE_PREFIXES = {
+    "-": "- ",
+    "•": "• ",
+    "*": "**",
+    "P": "Passed:",
+    "F": "Failed:",
+    "I": "Issues:",
+    "O": "Observations:",
+    "N": "Note:",
+}
+
+
+def split_blocks_by_scenarios(source: Union[str, Iterable[str]]):
+    # Accept either the full text or any iterable of lines (e.g. an open file) so logs
+    # can be parsed without holding the whole file in memory.
+    lines = source.splitlines() if isinstance(source, str) else source
     blocks = []
     current_suite = None
     current_block = None
     suite_titles: Dict[str, str] = {}
 
-    # Allow one or more heading hashes (e.g., #, ##, ###) before 'Suite N: Title'
-    suite_re = re.compile(r"^#+\s*Suite\s*(\d+)\s*:\s*(.+)")
-    # Match variations like `## **Scenario 1.1: Title**`, `## Scenario 1.1: Title`, or `### **Scenario 4.1` etc.
-    scen_re = re.compile(r"^\s*(?:#+|)\s*\*{0,2}\s*Scenario\s+(\d+\.\d+)\s*:\s*(.+)")
-
     def commit_block():
         nonlocal current_block
         if current_block:
             blocks.append(current_block)
             current_block = None
 
-    for line in lines:
-        m_suite = suite_re.match(line.strip())
+    for raw_line in lines:
+        line = raw_line.rstrip("\r\n")
+        m_suite = _SUITE_HEADING_RE.match(line.strip())
         if m_suite:
             # Starting a new suite; commit any ongoing scenario block
             commit_block()
@@ -46,7 +73,7 @@ def split_blocks_by_scenarios(text: str):
             suite_titles[suite_num] = current_suite
             continue
 
-        m_scen = scen_re.match(line.strip())
+        m_scen = _SCENARIO_HEADING_RE.match(line.strip())
         if m_scen:
             # Commit previous scenario block
             commit_block()
@@ -59,7 +86,7 @@ def split_blocks_by_scenarios(text: str):
                 # If current suite is absent or mismatched, fix it
                 cur_num = None
                 if preferred_suite:
-                    mm = re.search(r"Suite\s+(\d+)", preferred_suite)
+                    mm = _SUITE_NUM_RE.search(preferred_suite)
                     cur_num = mm.group(1) if mm else None
                 if (not preferred_suite) or (cur_num and cur_num != scen_suite_num):
                     preferred_suite = suite_titles.get(scen_suite_num, f"Suite {scen_suite_num}")
@@ -81,48 +108,46 @@ def split_blocks_by_scenarios(text: str):
 
 
 def classify_status_from_lines(lines):
-    # Heuristic classification based on presence of common tokens
-    text = "\n".join(lines)
+    # Heuristic classification based on presence of common tokens, in a single pass.
+    # The block's status is the highest-priority probe that matches any line, so once
+    # FAIL is seen, the status line found and the notes full, the rest can be skipped.
     status_line = None
+    notes = []
+    best = len(_STATUS_PROBES)  # index into _STATUS_PROBES of the best match so far
 
-    # Try to find an explicit results/status line first
     for ln in lines:
-        if re.search(r"\b(Result|Results|Status)\b", ln, re.IGNORECASE):
+        # The first explicit results/status line
+        if status_line is None and _STATUS_LINE_RE.search(ln):
             status_line = ln.strip()
-            break
 
-    def has_token(token):
-        return any(token in ln for ln in lines) or (token in text)
-
-    def has_word(word):
-        return re.search(fr"\b{word}\b", text, re.IGNORECASE) is not None
-
-    status = "UNKNOWN"
-    if has_token("❌") or has_word("FAIL"):
-        status = "FAIL"
-    elif has_token("⚠️") or has_word("PARTIAL"):
-        status = "PARTIAL"
-    elif has_token("✅") or has_word("PASS"):
-        status = "PASS"
-
-    # Notes: take a few informative lines (bullets or concise sentences)
-    notes = []
-    for ln in lines:
-        s = ln.strip()
-        if not s:
-            continue
-        if s.startswith(("- ", "• ", "**", "Passed:", "Failed:", "Issues:", "Observations:", "Note:")):
-            notes.append(s)
-        # keep it short
-        if len(notes) >= 6:
+        # Cheap literal probes first; the word-boundary regex only runs to confirm a
+        # hit (e.g. to reject "FAILED" for FAIL). Only higher-priority probes are tried,
+        # and the emoji scans are skipped outright for pure-ASCII lines.
+        if best:
+            ln_upper = ln.upper()
+            maybe_emoji = not ln.isascii()
+            for i in range(best):
+                _, emoji, literal, word_re = _STATUS_PROBES[i]
+                if (maybe_emoji and emoji in ln) or (literal in ln_upper and word_re.search(ln)):
+                    best = i
+                    break
+
+        # Notes: take a few informative lines (bullets or concise sentences)
+        if len(notes) < 6:
+            s = ln.strip()
+            prefix = _NOTE_PREFIXES.get(s[:1])
+            if prefix is not None and s.startswith(prefix):
+                notes.append(s)
+        elif best == 0 and status_line is not None:
             break
 
+    status = _STATUS_PROBES[best][0] if best < len(_STATUS_PROBES) else "UNKNOWN"
     return status, status_line, notes
 
 
 def parse_log(path: str):
-    text = read_text(path)
-    blocks = split_blocks_by_scenarios(text)
+    with open(path, "r", encoding="utf-8", errors="ignore") as f:
+        blocks = split_blocks_by_scenarios(f)
     scenarios = []
     for blk in blocks:
         status, status_line, notes = classify_status_from_lines(blk["lines"]) 
@@ -137,41 +162,121 @@ def parse_log(path: str):
     return scenarios
 
 
-def _try_get(d: Dict[str, Any], keys: List[str], default=None):
-    for k in keys:
-        if isinstance(d, dict) and k in d:
-            return d[k]
-    return default
+def _load_json_file(path: str) -> Any:
+    """Parse a JSON file from raw bytes, using orjson when it is installed."""
+    with open(path, "rb") as f:
+        data = f.read()
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass  # e.g. invalid UTF-8; retry leniently below
+    return json.loads(data.decode("utf-8", "ignore"))
 
 
+@lru_cache(maxsize=64)
+def _load_json_cached(path: str, mtime_ns: int) -> Any:
+    return _load_json_file(path)
+
+
+def load_metrics_json(path: str) -> Any:
+    """Parse a run.metrics.json once per process for as long as the file is unchanged.
+
+    The parsed object is shared between callers and must not be mutated.
+    """
+    return _load_json_cached(path, os.stat(path).st_mtime_ns)
+
+
+def _write_json_file(path: str, obj: Any) -> None:
+    """Write obj as indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(obj, f, indent=2, ensure_ascii=False)
+
+
+def _scan_dir(path: str) -> Dict[str, os.DirEntry]:
+    """Map file names to directory entries; empty if the directory is missing."""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except (FileNotFoundError, NotADirectoryError):
+        return {}
+
+
+def _scenario_sort_key(sid: str):
+    """Order 'N.M' scenario ids numerically; anything else sorts last."""
+    major, sep, minor = (sid or "").partition(".")
+    if sep and major.isdecimal() and minor.isdecimal():
+        return (int(major), int(minor))
+    return (9999, 9999)
+
+
+@lru_cache(maxsize=256)
 def _parse_suite_number_from_name(name: str) -> str:
     if not name:
         return None
-    m = re.search(r"Suite\s+(\d+)", name)
+    m = _SUITE_NUM_RE.search(name)
     if m:
         return m.group(1)
     return None
 
 
+def _find_suite_number_deep(obj: Any):
+    """Search string keys and values of a nested JSON object for 'Suite N'."""
+    if isinstance(obj, str):
+        m = _SUITE_NUM_RE.search(obj)
+        return m.group(1) if m else None
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            found = _find_suite_number_deep(k) or _find_suite_number_deep(v)
+            if found:
+                return found
+    elif isinstance(obj, list):
+        for v in obj:
+            found = _find_suite_number_deep(v)
+            if found:
+                return found
+    return None
+
+
 def parse_summary(summary_path: str) -> Dict[str, Dict[str, Any]]:
     """Return metrics keyed by suite number as string: { '1': {duration_seconds, input_tokens, output_tokens} }"""
     if not os.path.exists(summary_path):
         return {}
     try:
-        with open(summary_path, "r", encoding="utf-8", errors="ignore") as f:
-            data = json.load(f)
+        data = _load_json_file(summary_path)
     except Exception:
         return {}
 
     metrics_by_suite: Dict[str, Dict[str, Any]] = {}
 
-    # Common patterns: top-level 'suites' list with objects
-    suites = _try_get(data, ["suites", "per_suites", "suite_metrics", "suiteList"], default=[])
+    # Common patterns: top-level 'suites' list with objects. Key lookups below take the
+    # first key that is present, even when its value is falsy.
+    suites = []
+    if isinstance(data, dict):
+        for key in ("suites", "per_suites", "suite_metrics", "suiteList"):
+            if key in data:
+                suites = data[key]
+                break
     if isinstance(suites, list) and suites:
         for s in suites:
+            if isinstance(s, dict):
+                suite_name = s["name"] if "name" in s else s["suite"] if "suite" in s else s.get("title")
+                num = s["index"] if "index" in s else s["number"] if "number" in s else s.get("id")
+                duration = (
+                    s["duration_seconds"] if "duration_seconds" in s
+                    else s["seconds"] if "seconds" in s
+                    else s.get("duration")
+                )
+                usage = (s["usage"] if "usage" in s else s.get("tokens", {})) or {}
+            else:
+                suite_name = num = duration = None
+                usage = {}
+
             # Determine suite id/number
-            suite_name = _try_get(s, ["name", "suite", "title"], None)
-            num = _try_get(s, ["index", "number", "id"], None)
             if isinstance(num, int):
                 suite_num = str(num)
             else:
@@ -179,13 +284,21 @@ def parse_summary(summary_path: str) -> Dict[str, Dict[str, Any]]:
 
             if not suite_num:
                 # try parse from nested
-                suite_num = _parse_suite_number_from_name(json.dumps(s))
-
-            # Extract metrics
-            duration = _try_get(s, ["duration_seconds", "seconds", "duration"], None)
-            usage = _try_get(s, ["usage", "tokens"], {}) or {}
-            in_tok = _try_get(usage, ["input_token_count", "input_tokens", "input"], None)
-            out_tok = _try_get(usage, ["output_token_count", "output_tokens", "output"], None)
+                suite_num = _find_suite_number_deep(s)
+
+            # Extract token usage
+            in_tok = out_tok = None
+            if isinstance(usage, dict):
+                in_tok = (
+                    usage["input_token_count"] if "input_token_count" in usage
+                    else usage["input_tokens"] if "input_tokens" in usage
+                    else usage.get("input")
+                )
+                out_tok = (
+                    usage["output_token_count"] if "output_token_count" in usage
+                    else usage["output_tokens"] if "output_tokens" in usage
+                    else usage.get("output")
+                )
 
             if suite_num:
                 metrics_by_suite[suite_num] = {
@@ -210,12 +323,11 @@ def consolidate(workspace_root: str):
         if not os.path.exists(metrics_path):
             return {}
         try:
-            with open(metrics_path, "r", encoding="utf-8", errors="ignore") as f:
-                data = json.load(f)
+            data = load_metrics_json(metrics_path)
         except Exception:
             return {}
 
-        tokens_by_suite: Dict[str, Dict[str, Any]] = {}
+        tokens_by_suite: Dict[str, Dict[str, Any]] = defaultdict(dict)
 
         # Heuristic: look for per-suite entries that include a 'usage' object
         def extract_from_suites(suites_list):
@@ -233,29 +345,40 @@ def consolidate(workspace_root: str):
                         else:
                             suite_num = _parse_suite_number_from_name(str(suite_name)) if suite_name else None
                         if suite_num:
-                            tokens_by_suite.setdefault(suite_num, {})
+                            suite_tokens = tokens_by_suite[suite_num]
                             if in_tok is not None:
-                                tokens_by_suite[suite_num]["input_tokens"] = in_tok
+                                suite_tokens["input_tokens"] = in_tok
                             if out_tok is not None:
-                                tokens_by_suite[suite_num]["output_tokens"] = out_tok
+                                suite_tokens["output_tokens"] = out_tok
 
         for key in ("suites", "suite_runs", "per_suites", "suiteList"):
             suites_list = data.get(key)
             extract_from_suites(suites_list)
 
-        return tokens_by_suite
-    for folder, label in SERVERS:
-        log_path = os.path.join(artifacts_dir, folder, "run.log")
-        summary_path = os.path.join(artifacts_dir, folder, "run.summary.json")
-        metrics_path = os.path.join(artifacts_dir, folder, "run.metrics.json")
-        if not os.path.exists(log_path):
-            server_logs[folder] = []
-        else:
-            server_logs[folder] = parse_log(log_path)
-        server_suite_metrics[folder] = parse_summary(summary_path)
-        server_suite_tokens[folder] = parse_metrics_tokens(metrics_path)
+        return dict(tokens_by_suite)
+    def load_server(folder: str):
+        # One directory listing per server instead of an exists() check per file
+        entries = _scan_dir(os.path.join(artifacts_dir, folder))
+        log_entry = entries.get("run.log")
+        summary_entry = entries.get("run.summary.json")
+        metrics_entry = entries.get("run.metrics.json")
+        return (
+            folder,
+            parse_log(log_entry.path) if log_entry is not None else [],
+            parse_summary(summary_entry.path) if summary_entry is not None else {},
+            parse_metrics_tokens(metrics_entry.path) if metrics_entry is not None else {},
+        )
+
+    # Servers are independent, so read and parse their artifacts concurrently
+    with ThreadPoolExecutor(max_workers=len(SERVERS)) as pool:
+        for folder, logs, suite_metrics, suite_tokens in pool.map(load_server, [f for f, _ in SERVERS]):
+            server_logs[folder] = logs
+            server_suite_metrics[folder] = suite_metrics
+            server_suite_tokens[folder] = suite_tokens
 
     scenarios_by_id = {}
+    # Suite metrics per (scenario id, folder), kept apart so entries already have the JSON shape
+    scenario_metrics: Dict[Tuple[str, str], Dict[str, Any]] = {}
     for folder, label in SERVERS:
         for s in server_logs.get(folder, []):
             sid = s.get("id") or "UNKNOWN"
@@ -271,54 +394,45 @@ def consolidate(workspace_root: str):
                 entry["title"] = s.get("title")
             if not entry.get("suite") and s.get("suite"):
                 entry["suite"] = s.get("suite")
-            suite_str = s.get("suite") or ""
-            m = re.search(r"Suite\s+(\d+)", suite_str)
-            suite_num = m.group(1) if m else None
+            suite_num = _parse_suite_number_from_name(s.get("suite") or "")
             sm = server_suite_metrics.get(folder, {})
             sm_for_suite = sm.get(suite_num or "", {}) if sm else {}
 
             entry["servers"][folder] = {
-                "label": dict(SERVERS).get(folder, folder),
+                "label": _SERVER_LABELS.get(folder, folder),
                 "status": s.get("status"),
                 "status_text": s.get("status_text"),
                 "notes": s.get("notes") or [],
-                "metrics": {
-                    "suite_duration_seconds": sm_for_suite.get("duration_seconds"),
-                    "suite_input_tokens": sm_for_suite.get("input_tokens"),
-                    "suite_output_tokens": sm_for_suite.get("output_tokens"),
-                }
+            }
+            scenario_metrics[(sid, folder)] = {
+                "suite_duration_seconds": sm_for_suite.get("duration_seconds"),
+                "suite_input_tokens": sm_for_suite.get("input_tokens"),
+                "suite_output_tokens": sm_for_suite.get("output_tokens"),
             }
 
     consolidated = {
         "generated_at": datetime.utcnow().isoformat() + "Z",
         "scenarios": sorted(
             scenarios_by_id.values(),
-            key=lambda x: (
-                tuple(map(int, x["id"].split("."))) if re.match(r"^\d+\.\d+$", x["id"] or "") else (9999, 9999)
-            )
+            key=lambda x: _scenario_sort_key(x["id"])
         )
     }
 
-    per_server_suite_counts: Dict[str, Dict[str, int]] = {k: {} for k, _ in SERVERS}
+    per_server_suite_counts: Dict[str, Dict[str, int]] = {k: defaultdict(int) for k, _ in SERVERS}
     for sc in consolidated["scenarios"]:
-        suite_str = sc.get("suite") or ""
-        m = re.search(r"Suite\s+(\d+)", suite_str)
-        suite_num = m.group(1) if m else None
+        suite_num = _parse_suite_number_from_name(sc.get("suite") or "")
         if not suite_num:
             continue
         for folder, _ in SERVERS:
             if sc["servers"].get(folder):
-                per_server_suite_counts[folder][suite_num] = per_server_suite_counts[folder].get(suite_num, 0) + 1
+                per_server_suite_counts[folder][suite_num] += 1
 
     for sc in consolidated["scenarios"]:
-        suite_str = sc.get("suite") or ""
-        m = re.search(r"Suite\s+(\d+)", suite_str)
-        suite_num = m.group(1) if m else None
+        suite_num = _parse_suite_number_from_name(sc.get("suite") or "")
         for folder, _ in SERVERS:
-            sv = sc["servers"].get(folder)
-            if not sv:
+            if not sc["servers"].get(folder):
                 continue
-            metrics = sv.get("metrics") or {}
+            metrics = scenario_metrics.get((sc["id"], folder)) or {}
             count = per_server_suite_counts.get(folder, {}).get(suite_num or "", 0)
             if count and metrics:
                 dur = metrics.get("suite_duration_seconds") or 0
@@ -335,8 +449,7 @@ def consolidate(workspace_root: str):
     suites_map: Dict[str, str] = {}
     for sc in consolidated["scenarios"]:
         suite_str = sc.get("suite") or "(Unknown Suite)"
-        m = re.search(r"Suite\s+(\d+)", suite_str or "")
-        suite_num = m.group(1) if m else None
+        suite_num = _parse_suite_number_from_name(suite_str)
         if suite_num and suite_num not in suites_map:
             suites_map[suite_num] = suite_str
     suites_order_nums = sorted(suites_map.keys(), key=lambda x: int(x))
@@ -364,94 +477,75 @@ def consolidate(workspace_root: str):
             "servers": servers_totals
         })
 
-    scenarios_for_json: List[Dict[str, Any]] = []
-    for sc in consolidated["scenarios"]:
-        sc_copy = {
-            "id": sc.get("id"),
-            "title": sc.get("title"),
-            "suite": sc.get("suite"),
-            "servers": {}
-        }
-        for folder, _ in SERVERS:
-            sv = sc["servers"].get(folder)
-            if not sv:
-                continue
-            sv_copy = {
-                "label": sv.get("label"),
-                "status": sv.get("status"),
-                "status_text": sv.get("status_text"),
-                "notes": sv.get("notes") or []
-            }
-            sc_copy["servers"][folder] = sv_copy
-        scenarios_for_json.append(sc_copy)
-
     consolidated_json = {
         "generated_at": consolidated["generated_at"],
-        "scenarios": scenarios_for_json,
+        "scenarios": consolidated["scenarios"],
         "suite_totals": suite_totals_list
     }
 
-    with open(json_path, "w", encoding="utf-8") as jf:
-        json.dump(consolidated_json, jf, indent=2, ensure_ascii=False)
+    _write_json_file(json_path, consolidated_json)
 
     md_path = os.path.join(out_dir, "consolidated_logs.md")
-    with open(md_path, "w", encoding="utf-8") as mf:
-        mf.write("# Consolidated Test Case Results\n\n")
-        mf.write(f"Generated at: {consolidated['generated_at']}\n\n")
-
-        grouped: Dict[str, List[Dict[str, Any]]] = {}
-        suite_num_name: Dict[str, str] = {}
-        for sc in consolidated["scenarios"]:
-            suite_str = sc.get("suite") or "(Unknown Suite)"
-            m = re.search(r"Suite\s+(\d+)", suite_str or "")
-            suite_num = m.group(1) if m else None
-            if not suite_num:
-                continue
-            if suite_str not in grouped:
-                grouped[suite_str] = []
-                suite_num_name[suite_num] = suite_str
-            grouped[suite_str].append(sc)
-
-        ordered_suite_nums = sorted(suite_num_name.keys(), key=lambda x: int(x))
-        for suite_num in ordered_suite_nums:
-            suite_str = suite_num_name[suite_num]
-            mf.write(f"# {suite_str}\n\n")
-            for sc in grouped[suite_str]:
-                mf.write(f"## Scenario {sc['id']}: {sc.get('title') or ''}\n")
-                for folder, label in SERVERS:
-                    sv = sc["servers"].get(folder)
-                    if not sv:
-                        mf.write(f"- {label}: No data\n")
-                        continue
-                    mf.write(f"- {label}: {sv.get('status') or 'UNKNOWN'}\n")
-                    if sv.get("status_text"):
-                        mf.write(f"  - {sv['status_text']}\n")
-                    notes = sv.get("notes") or []
-                    for n in notes[:4]:
-                        mf.write(f"  - {n}\n")
-                mf.write("\n")
-
-            mf.write("### Suite Totals\n")
+    chunks: List[str] = []
+    append = chunks.append
+    append("# Consolidated Test Case Results\n\n")
+    append(f"Generated at: {consolidated['generated_at']}\n\n")
+
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    suite_num_name: Dict[str, str] = {}
+    for sc in consolidated["scenarios"]:
+        suite_str = sc.get("suite") or "(Unknown Suite)"
+        suite_num = _parse_suite_number_from_name(suite_str)
+        if not suite_num:
+            continue
+        if suite_str not in grouped:
+            grouped[suite_str] = []
+            suite_num_name[suite_num] = suite_str
+        grouped[suite_str].append(sc)
+
+    ordered_suite_nums = sorted(suite_num_name.keys(), key=lambda x: int(x))
+    for suite_num in ordered_suite_nums:
+        suite_str = suite_num_name[suite_num]
+        append(f"# {suite_str}\n\n")
+        for sc in grouped[suite_str]:
+            append(f"## Scenario {sc['id']}: {sc.get('title') or ''}\n")
             for folder, label in SERVERS:
-                dur = None
-                sm = server_suite_metrics.get(folder, {})
-                if suite_num and sm.get(suite_num):
-                    dur = sm[suite_num].get("duration_seconds")
-                toks = server_suite_tokens.get(folder, {}).get(suite_num or "", {})
-                in_tok = toks.get("input_tokens")
-                out_tok = toks.get("output_tokens")
-                parts = []
-                if dur is not None:
-                    parts.append(f"time={dur:.2f}s")
-                if in_tok is not None:
-                    parts.append(f"in_tokens={in_tok}")
-                if out_tok is not None:
-                    parts.append(f"out_tokens={out_tok}")
-                if parts:
-                    mf.write(f"- {label}: "+", ".join(parts)+"\n")
-                else:
-                    mf.write(f"- {label}: No suite totals available\n")
-            mf.write("\n")
+                sv = sc["servers"].get(folder)
+                if not sv:
+                    append(f"- {label}: No data\n")
+                    continue
+                append(f"- {label}: {sv.get('status') or 'UNKNOWN'}\n")
+                if sv.get("status_text"):
+                    append(f"  - {sv['status_text']}\n")
+                notes = sv.get("notes") or []
+                for n in notes[:4]:
+                    append(f"  - {n}\n")
+            append("\n")
+
+        append("### Suite Totals\n")
+        for folder, label in SERVERS:
+            dur = None
+            sm = server_suite_metrics.get(folder, {})
+            if suite_num and sm.get(suite_num):
+                dur = sm[suite_num].get("duration_seconds")
+            toks = server_suite_tokens.get(folder, {}).get(suite_num or "", {})
+            in_tok = toks.get("input_tokens")
+            out_tok = toks.get("output_tokens")
+            parts = []
+            if dur is not None:
+                parts.append(f"time={dur:.2f}s")
+            if in_tok is not None:
+                parts.append(f"in_tokens={in_tok}")
+            if out_tok is not None:
+                parts.append(f"out_tokens={out_tok}")
+            if parts:
+                append(f"- {label}: "+", ".join(parts)+"\n")
+            else:
+                append(f"- {label}: No suite totals available\n")
+        append("\n")
+
+    with open(md_path, "w", encoding="utf-8") as mf:
+        mf.write("".join(chunks))
 
     return json_path, md_path
 
@@ -1,13 +1,18 @@
-import json
 import os
 from collections import Counter
-from statistics import mean
+from heapq import nlargest
+from operator import itemgetter
 from typing import Any, Dict, List
 
+try:
+    from .log_consolidator import _write_json_file, load_metrics_json
+except ImportError:
+    from log_consolidator import _write_json_file, load_metrics_json
+
 
 def load_json(path: str) -> Dict[str, Any]:
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    # Shares parsed metrics with log_consolidator when both run in one process
+    return load_metrics_json(path)
 
 
 def compute_kpis(name: str, data: Dict[str, Any]) -> Dict[str, Any]:
@@ -26,14 +31,21 @@ def compute_kpis(name: str, data: Dict[str, Any]) -> Dict[str, Any]:
     suite_durations = [s.get("duration_seconds", 0) or 0 for s in suites]
     avg_suite_duration = (sum(suite_durations) / len(suite_durations)) if suite_durations else None
 
-    tool_calls: List[Dict[str, Any]] = []
+    # Single pass over every suite's tool calls
+    tool_count_total = 0
+    errors_count = 0
+    tool_duration_sum = 0.0
+    tool_name_counts: Counter = Counter()
     for s in suites:
-        tool_calls.extend(s.get("tool_calls", []))
-
-    tool_count_total = len(tool_calls)
-    errors_count = sum(1 for t in tool_calls if t.get("error", False))
-    tool_name_counts = Counter(t.get("tool_name") for t in tool_calls if t.get("tool_name"))
-    avg_tool_duration = mean([t.get("duration_seconds", 0) or 0 for t in tool_calls]) if tool_calls else None
+        for t in s.get("tool_calls", []):
+            tool_count_total += 1
+            if t.get("error", False):
+                errors_count += 1
+            tool_duration_sum += t.get("duration_seconds", 0) or 0
+            tool_name = t.get("tool_name")
+            if tool_name:
+                tool_name_counts[tool_name] += 1
+    avg_tool_duration = (tool_duration_sum / tool_count_total) if tool_count_total else None
 
     return {
         "name": name,
@@ -46,7 +58,7 @@ def compute_kpis(name: str, data: Dict[str, Any]) -> Dict[str, Any]:
         "avg_suite_duration": avg_suite_duration,
         "tool_calls_total": tool_count_total,
         "tool_errors": errors_count,
-        "top_tools": tool_name_counts.most_common(10),
+        "top_tools": nlargest(10, tool_name_counts.items(), key=itemgetter(1)),
         "avg_tool_duration": avg_tool_duration,
     }
 
@@ -74,8 +86,8 @@ def main() -> None:
     os.makedirs(output_dir, exist_ok=True)
 
     output_json = os.path.join(output_dir, "run.comparison.json")
-    with open(output_json, "w", encoding="utf-8") as f:
-        json.dump({"comparisons": results, "missing": missing}, f, indent=2)
+    comparison = {"comparisons": results, "missing": missing}
+    _write_json_file(output_json, comparison)
 
     output_md = os.path.join(output_dir, "run.comparison.md")
     lines: List[str] = []
@@ -4,19 +4,20 @@ from __future__ import annotations
 
 import argparse
 import asyncio
-import base64
 import binascii
 import contextlib
+import itertools
 import json
 import logging
 import os
 import re
+import secrets
 import subprocess
+import sys
 import time
-import uuid
 from pathlib import Path
-from collections import OrderedDict
-from typing import Annotated, Any, Dict, Optional
+from functools import lru_cache
+from typing import Annotated, Any, Callable, Dict, Optional
 
 from agent_framework import MCPStdioTool, TextContent, ai_function
 from agent_framework.anthropic import AnthropicClient
@@ -25,6 +26,17 @@ from dotenv import load_dotenv
 from pydantic import Field
 from mcp import types as mcp_types
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # SIMD-accelerated, API-compatible replacement for base64.b64decode
+    from pybase64 import b64decode as _b64decode
+except ImportError:
+    from base64 import b64decode as _b64decode
+
 try:
     from .agent_debug import log_agent_stream_metadata
 except ImportError:
@@ -35,6 +47,11 @@ try:
 except ImportError:
     from agent_metrics import AgentRunMetricsCollector, dump_metrics_to_file
 
+try:
+    from .runner_helpers import find_phrase, wait_for_server
+except ImportError:
+    from runner_helpers import find_phrase, wait_for_server
+
 def _build_comparison_summary(run_metrics: dict, summary_text: str, mcp_id: str) -> dict:
     run = run_metrics.get("run", {}) or {}
     suites = run_metrics.get("suites", []) or []
@@ -104,35 +121,57 @@ DEFAULT_LOG_PATH = MCP_DIR / "run.log"
 AGGREGATOR_LOG_PATH = Path("artifacts") / "mcp-comparison.log"
 SNAPSHOT_DIR = Path("artifacts") / "playwright-snapshots"
 SERVER_READY_TIMEOUT = 15
-SERVER_CHECK_INTERVAL = 0.5
+SERVER_CHECK_INTERVAL = 0.05
+# Suites share one Playwright MCP browser session, so they run one at a time unless raised
+SUITE_CONCURRENCY = max(1, int(os.getenv("PLAYWRIGHT_SUITE_CONCURRENCY", "1")))
+# Stream updates are handed to the metrics collector in batches of this size
+METRICS_BATCH_SIZE = 64
 
 LOGGER = logging.getLogger("playwright_test_runner")
 
 
+@lru_cache(maxsize=1)
 def _ensure_snapshot_dir() -> Path:
     snapshot_path = (PROJECT_ROOT / SNAPSHOT_DIR).resolve()
     snapshot_path.mkdir(parents=True, exist_ok=True)
     return snapshot_path
 
 
+_EXTENSION_BY_MIME = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/jpg": ".jpg",
+    "image/webp": ".webp",
+    "image/svg+xml": ".svg",
+    "application/json": ".json",
+}
+
+
 def _derive_extension(mime_type: str | None) -> str:
     if not mime_type:
         return ".bin"
-    lowered = mime_type.lower()
-    if lowered == "image/png":
-        return ".png"
-    if lowered in {"image/jpeg", "image/jpg"}:
-        return ".jpg"
-    if lowered == "image/webp":
-        return ".webp"
-    if lowered == "image/svg+xml":
-        return ".svg"
-    if lowered == "application/json":
-        return ".json"
-    return ".bin"
+    return _EXTENSION_BY_MIME.get(mime_type.lower(), ".bin")
 
 
 _DATA_URI_PATTERN = re.compile(r"^data:(?P<mime>[^;]+);base64,(?P<data>.+)$", re.DOTALL)
+# Snapshot file names: a per-process random tag plus a counter, unique without a syscall each
+_SNAPSHOT_RUN_TAG = secrets.token_hex(4)
+_SNAPSHOT_COUNTER = itertools.count()
+# Decode chunk size in base64 characters; a multiple of 4 so each chunk decodes on its own.
+_BASE64_CHUNK_CHARS = 64 * 1024
+
+
+def _write_base64_file(encoded: str, file_path: Path) -> None:
+    """Decode base64 text into file_path chunk by chunk instead of as one bytes blob."""
+    padding_at = encoded.find("=")
+    if len(encoded) % 4 or padding_at not in (-1, len(encoded) - 1, len(encoded) - 2):
+        # Irregular padding: decode in one go so the decoder's leniency rules still apply
+        binary = _b64decode(encoded, validate=True)
+        file_path.write_bytes(binary)
+        return
+    with file_path.open("wb") as fh:
+        for start in range(0, len(encoded), _BASE64_CHUNK_CHARS):
+            fh.write(_b64decode(encoded[start:start + _BASE64_CHUNK_CHARS], validate=True))
 
 
 def _save_base64_blob(
@@ -149,99 +188,134 @@ def _save_base64_blob(
         mime_type = mime_hint
         encoded = blob.strip()
 
-    try:
-        binary = base64.b64decode(encoded, validate=True)
-    except (binascii.Error, ValueError) as exc:
-        raise ValueError("Invalid base64 blob provided by MCP tool") from exc
-
     snapshot_dir = _ensure_snapshot_dir()
     extension = _derive_extension(mime_type)
-    filename = f"{prefix}-{uuid.uuid4().hex}{extension}"
+    filename = f"{prefix}-{_SNAPSHOT_RUN_TAG}-{next(_SNAPSHOT_COUNTER):08x}{extension}"
     file_path = snapshot_dir / filename
-    file_path.write_bytes(binary)
-    return file_path.relative_to(PROJECT_ROOT).as_posix()
+    try:
+        _write_base64_file(encoded, file_path)
+    except (binascii.Error, ValueError) as exc:
+        file_path.unlink(missing_ok=True)
+        raise ValueError("Invalid base64 blob provided by MCP tool") from exc
+    return f"{SNAPSHOT_DIR.as_posix()}/{filename}"
 
 
-def _sanitize_playwright_content(
-    item: mcp_types.ImageContent
-    | mcp_types.TextContent
-    | mcp_types.AudioContent
-    | mcp_types.EmbeddedResource
-    | mcp_types.ResourceLink
-    | mcp_types.ToolUseContent
-    | mcp_types.ToolResultContent,
-) -> list[TextContent]:
-    if isinstance(item, mcp_types.TextContent):
-        text = item.text or ""
-        if _DATA_URI_PATTERN.search(text):
-            try:
-                saved_path = _save_base64_blob(text, mime_hint=None)
-                return [
-                    TextContent(
-                        text=f"[Playwright snapshot saved to {saved_path}]",
-                        raw_representation=item,
-                    )
-                ]
-            except ValueError:
-                return [TextContent(text="[Playwright snapshot decoding failed]", raw_representation=item)]
-        return [TextContent(text=text, raw_representation=item)]
-
-    if isinstance(item, mcp_types.ImageContent):
-        data = item.data or ""
+def _sanitize_text_content(item: mcp_types.TextContent) -> list[TextContent]:
+    text = item.text or ""
+    # The pattern is anchored at the start, so a prefix check rules out almost all text
+    if text.startswith("data:") and _DATA_URI_PATTERN.match(text):
         try:
-            saved_path = _save_base64_blob(data, mime_hint=item.mimeType or "image/png")
+            saved_path = _save_base64_blob(text, mime_hint=None)
             return [
                 TextContent(
-                    text=f"[Playwright image saved to {saved_path} ({item.mimeType})]",
+                    text=f"[Playwright snapshot saved to {saved_path}]",
                     raw_representation=item,
                 )
             ]
         except ValueError:
-            return [TextContent(text="[Playwright image decoding failed]", raw_representation=item)]
+            return [TextContent(text="[Playwright snapshot decoding failed]", raw_representation=item)]
+    return [TextContent(text=text, raw_representation=item)]
 
-    if isinstance(item, mcp_types.EmbeddedResource) and isinstance(item.resource, mcp_types.BlobResourceContents):
-        blob = item.resource.blob or ""
-        try:
-            saved_path = _save_base64_blob(blob, mime_hint=item.resource.mimeType)
-            return [
-                TextContent(
-                    text=f"[Playwright resource saved to {saved_path} ({item.resource.mimeType})]",
-                    raw_representation=item,
-                )
-            ]
-        except ValueError:
-            return [TextContent(text="[Playwright resource decoding failed]", raw_representation=item)]
 
-    if isinstance(item, mcp_types.ResourceLink):
+def _sanitize_image_content(item: mcp_types.ImageContent) -> list[TextContent]:
+    data = item.data or ""
+    try:
+        saved_path = _save_base64_blob(data, mime_hint=item.mimeType or "image/png")
         return [
             TextContent(
-                text=f"[Playwright resource link: {item.uri} ({item.mimeType or 'application/octet-stream'})]",
+                text=f"[Playwright image saved to {saved_path} ({item.mimeType})]",
                 raw_representation=item,
             )
         ]
+    except ValueError:
+        return [TextContent(text="[Playwright image decoding failed]", raw_representation=item)]
 
-    if isinstance(item, mcp_types.ToolResultContent):
-        contents: list[TextContent] = []
-        if item.content:
-            for nested in item.content:
-                contents.extend(_sanitize_playwright_content(nested))
-        elif item.structuredContent is not None:
-            try:
-                structured_text = json.dumps(item.structuredContent)
-            except TypeError:
-                structured_text = str(item.structuredContent)
-            contents.append(TextContent(text=structured_text, raw_representation=item))
-        if not contents:
-            contents.append(TextContent(text="[Playwright tool returned empty content]", raw_representation=item))
-        return contents
-
-    if isinstance(item, mcp_types.ToolUseContent):
+
+def _sanitize_embedded_resource(item: mcp_types.EmbeddedResource) -> Optional[list[TextContent]]:
+    if not isinstance(item.resource, mcp_types.BlobResourceContents):
+        return None
+    blob = item.resource.blob or ""
+    try:
+        saved_path = _save_base64_blob(blob, mime_hint=item.resource.mimeType)
         return [
             TextContent(
-                text=f"[Playwright tool invocation: {item.name}]",
+                text=f"[Playwright resource saved to {saved_path} ({item.resource.mimeType})]",
                 raw_representation=item,
             )
         ]
+    except ValueError:
+        return [TextContent(text="[Playwright resource decoding failed]", raw_representation=item)]
+
+
+def _sanitize_resource_link(item: mcp_types.ResourceLink) -> list[TextContent]:
+    return [
+        TextContent(
+            text=f"[Playwright resource link: {item.uri} ({item.mimeType or 'application/octet-stream'})]",
+            raw_representation=item,
+        )
+    ]
+
+
+def _sanitize_tool_result(item: mcp_types.ToolResultContent) -> list[TextContent]:
+    contents: list[TextContent] = []
+    if item.content:
+        for nested in item.content:
+            contents.extend(_sanitize_playwright_content(nested))
+    elif item.structuredContent is not None:
+        try:
+            if orjson is not None:
+                # orjson's encode errors subclass TypeError, so the fallback below still applies
+                structured_text = orjson.dumps(item.structuredContent, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+            else:
+                structured_text = json.dumps(item.structuredContent)
+        except TypeError:
+            structured_text = str(item.structuredContent)
+        contents.append(TextContent(text=structured_text, raw_representation=item))
+    if not contents:
+        contents.append(TextContent(text="[Playwright tool returned empty content]", raw_representation=item))
+    return contents
+
+
+def _sanitize_tool_use(item: mcp_types.ToolUseContent) -> list[TextContent]:
+    return [
+        TextContent(
+            text=f"[Playwright tool invocation: {item.name}]",
+            raw_representation=item,
+        )
+    ]
+
+
+# Content sanitizers keyed by exact MCP content type; the order is the isinstance
+# fallback order for subclasses. A sanitizer returning None means "not captured".
+_CONTENT_SANITIZERS: dict[type, Callable[[Any], Optional[list[TextContent]]]] = {
+    mcp_types.TextContent: _sanitize_text_content,
+    mcp_types.ImageContent: _sanitize_image_content,
+    mcp_types.EmbeddedResource: _sanitize_embedded_resource,
+    mcp_types.ResourceLink: _sanitize_resource_link,
+    mcp_types.ToolResultContent: _sanitize_tool_result,
+    mcp_types.ToolUseContent: _sanitize_tool_use,
+}
+
+
+def _sanitize_playwright_content(
+    item: mcp_types.ImageContent
+    | mcp_types.TextContent
+    | mcp_types.AudioContent
+    | mcp_types.EmbeddedResource
+    | mcp_types.ResourceLink
+    | mcp_types.ToolUseContent
+    | mcp_types.ToolResultContent,
+) -> list[TextContent]:
+    sanitizer = _CONTENT_SANITIZERS.get(type(item))
+    if sanitizer is None:
+        sanitizer = next(
+            (candidate for content_type, candidate in _CONTENT_SANITIZERS.items() if isinstance(item, content_type)),
+            None,
+        )
+    if sanitizer is not None:
+        contents = sanitizer(item)
+        if contents is not None:
+            return contents
 
     return [
         TextContent(
@@ -286,25 +360,54 @@ def read_test_plan(plan_path: Path) -> str:
     return plan_path.read_text(encoding="utf-8").strip()
 
 
+# Candidate heading lines (## and deeper) and horizontal rules in a Markdown plan
+_PLAN_HEADING_PATTERN = re.compile(r"^[^\S\n]*##.*$", re.MULTILINE)
+_PLAN_RULE_LINE_PATTERN = re.compile(r"^[^\S\n]*---[^\S\n]*(?:\n|\Z)", re.MULTILINE)
+
+
+def _sanitize_plan_heading(text: str) -> str:
+    cleaned = _WHITESPACE_PATTERN.sub(" ", text.strip())
+    cleaned = cleaned.strip("* ")
+    return cleaned
+
+
+def parse_plan_structure(
+    plan_markdown: str,
+) -> tuple[list[tuple[str, str]], dict[str, list[str]]]:
+    """Return the plan's per-suite sections and its suite -> scenarios outline in one pass."""
+    sections: list[tuple[str, str]] = []
+    outline: dict[str, list[str]] = {}
+    current_suite: Optional[str] = None
+    open_section: Optional[tuple[str, int]] = None  # (heading line, body start offset)
+
+    def close_section(body_end: int) -> None:
+        heading, body_start = open_section
+        body = plan_markdown[body_start:body_end]
+        if "---" in body:
+            body = _PLAN_RULE_LINE_PATTERN.sub("", body)
+        sections.append((heading[3:].strip(), (heading + body).strip()))
+
+    for match in _PLAN_HEADING_PATTERN.finditer(plan_markdown):
+        stripped = match.group().strip()
+        if stripped.startswith("## "):
+            if open_section is not None:
+                close_section(match.start())
+            open_section = (stripped, match.end())
+            current_suite = _sanitize_plan_heading(stripped[3:]) or "General"
+            outline.setdefault(current_suite, [])
+        elif stripped.startswith("###"):
+            if not current_suite:
+                current_suite = "General"
+                outline.setdefault(current_suite, [])
+            outline[current_suite].append(_sanitize_plan_heading(stripped.lstrip("#")))
+    if open_section is not None:
+        close_section(len(plan_markdown))
+    return sections, outline
+
+
 def split_plan_into_suites(plan_markdown: str) -> list[tuple[str, str]]:
     """Break the Markdown plan into per-suite sections."""
-    suites: list[tuple[str, str]] = []
-    current_name: Optional[str] = None
-    current_lines: list[str] = []
-    for raw_line in plan_markdown.splitlines():
-        stripped = raw_line.strip()
-        if stripped.startswith("## "):
-            if current_name and current_lines:
-                suites.append((current_name, "\n".join(current_lines).strip()))
-            current_name = stripped[3:].strip()
-            current_lines = [stripped]
-        elif current_name:
-            if stripped == "---":
-                continue
-            current_lines.append(raw_line)
-    if current_name and current_lines:
-        suites.append((current_name, "\n".join(current_lines).strip()))
-    return [(name, section) for name, section in suites if section]
+    return parse_plan_structure(plan_markdown)[0]
 
 
 def build_execution_prompt(
@@ -351,9 +454,8 @@ def start_local_server(
     *,
     command: Optional[list[str]] = None,
     cwd: Optional[Path] = None,
-    timeout: int = SERVER_READY_TIMEOUT,
 ) -> subprocess.Popen[str]:
-    """Start the local server hosting the generated app."""
+    """Start the local server hosting the generated app; see wait_for_local_server."""
     server_cmd = list(command or DEFAULT_SERVER_COMMAND)
     server_cwd = cwd or DEFAULT_SERVER_CWD
     if not server_cwd.is_absolute():
@@ -371,23 +473,19 @@ def start_local_server(
         stderr=subprocess.DEVNULL,
         text=True,
     )
+    return process
 
-    start_time = time.time()
-    while True:
-        if process.poll() is not None:
-            raise RuntimeError(
-                "Local server terminated unexpectedly before readiness.\n"
-                f"Command: {' '.join(server_cmd)}"
-            )
-        if time.time() - start_time >= timeout:
-            process.terminate()
-            raise TimeoutError(
-                f"Server did not become ready within {timeout} seconds."
-            )
-        time.sleep(SERVER_CHECK_INTERVAL)
-        break
 
-    return process
+async def wait_for_local_server(
+    process: subprocess.Popen[str],
+    *,
+    url: Optional[str] = DEFAULT_BASE_URL,
+    timeout: int = SERVER_READY_TIMEOUT,
+) -> None:
+    """Wait without blocking the event loop until the local server accepts connections."""
+    await asyncio.to_thread(
+        wait_for_server, process, url, timeout=timeout, interval=SERVER_CHECK_INTERVAL
+    )
 
 
 def stop_local_server(process: subprocess.Popen[str]) -> None:
@@ -402,49 +500,40 @@ def stop_local_server(process: subprocess.Popen[str]) -> None:
             process.kill()
 
 
-def summarize_execution_output(output: str, plan_markdown: str | None = None) -> str:
-    """Create a structured summary of the MCP execution output."""
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[\.\?\!])\s+(?=[A-Z])")
+# Leading phrases in agent narration rewritten into summary wording
+_SUMMARY_REPLACEMENTS = (
+    ("let me ", "Attempted to "),
+    ("i'll ", "Planned to "),
+    ("i notice ", "Observation: "),
+    ("it appears ", "Observation: "),
+    ("perfect!", "Outcome:"),
+)
+
+
+def summarize_execution_output(
+    output: str,
+    plan_markdown: str | None = None,
+    *,
+    plan_structure: Optional[dict[str, list[str]]] = None,
+) -> str:
+    """Create a structured summary of the MCP execution output.
+
+    ``plan_structure`` is the outline from ``parse_plan_structure``; pass it to skip re-parsing
+    ``plan_markdown``.
+    """
     if not output.strip():
         return "No output was produced by PlaywrightRunnerAgent."
 
     normalized_output = output.replace("\r\n", "\n")
 
-    def sanitize_heading(text: str) -> str:
-        cleaned = re.sub(r"\s+", " ", text.strip())
-        cleaned = cleaned.strip("* ")
-        return cleaned
-
-    def parse_plan(markdown: str) -> OrderedDict[str, list[str]]:
-        suites = OrderedDict()
-        current_suite: Optional[str] = None
-        for raw_line in markdown.splitlines():
-            stripped = raw_line.strip()
-            if stripped.startswith("## "):
-                suite_name = sanitize_heading(stripped[3:])
-                current_suite = suite_name or "General"
-                suites.setdefault(current_suite, [])
-                continue
-            if stripped.startswith("###"):
-                scenario_name = sanitize_heading(stripped.lstrip("#"))
-                if not current_suite:
-                    current_suite = "General"
-                    suites.setdefault(current_suite, [])
-                suites[current_suite].append(scenario_name)
-        return suites
-
     def humanize_sentence(sentence: str) -> str:
-        text = re.sub(r"\s+", " ", sentence.strip().rstrip(":"))
+        text = _WHITESPACE_PATTERN.sub(" ", sentence.strip().rstrip(":"))
         if not text:
             return ""
         lowered = text.lower()
-        replacements = [
-            ("let me ", "Attempted to "),
-            ("i'll ", "Planned to "),
-            ("i notice ", "Observation: "),
-            ("it appears ", "Observation: "),
-            ("perfect!", "Outcome:"),
-        ]
-        for trigger, repl in replacements:
+        for trigger, repl in _SUMMARY_REPLACEMENTS:
             if lowered.startswith(trigger):
                 text = repl + text[len(trigger):].lstrip()
                 break
@@ -465,57 +554,53 @@ def summarize_execution_output(output: str, plan_markdown: str | None = None) ->
         for raw_line in raw_lines:
             if raw_line.startswith("##") or raw_line.startswith("###"):
                 continue
-            if raw_line.lower().startswith("summary saved to"):
+            if raw_line[:16].lower().startswith("summary saved to"):
                 continue
-            normalized = re.sub(r"\s+", " ", raw_line)
-            pieces = re.split(r"(?<=[\.\?\!])\s+(?=[A-Z])", normalized)
+            normalized = _WHITESPACE_PATTERN.sub(" ", raw_line)
+            pieces = _SENTENCE_SPLIT_PATTERN.split(normalized)
             if not pieces:
                 pieces = [normalized]
             for piece in pieces:
                 fragments.append(piece.strip())
 
-        bullets: list[str] = []
-        seen: set[str] = set()
+        unique: dict[str, str] = {}
         for fragment in fragments:
             sentence = humanize_sentence(fragment)
-            if not sentence:
-                continue
-            key = sentence.lower()
-            if key in seen:
-                continue
-            seen.add(key)
-            bullets.append(f"- {sentence}")
-        return bullets[:5]
+            if sentence:
+                unique.setdefault(sentence.lower(), sentence)
+                if len(unique) == 5:
+                    break
+        return [f"- {sentence}" for sentence in unique.values()]
 
-    plan_structure = parse_plan(plan_markdown) if plan_markdown else OrderedDict()
+    if plan_structure is None:
+        plan_structure = parse_plan_structure(plan_markdown)[1] if plan_markdown else {}
 
-    summary_data: OrderedDict[str, OrderedDict[str, list[str]]] = OrderedDict()
-    summary_data["General"] = OrderedDict()
+    summary_data: dict[str, dict[str, list[str]]] = {}
+    summary_data["General"] = {}
     summary_data["General"]["Overview"] = []
 
     if plan_structure:
         for suite_name, scenarios in plan_structure.items():
-            summary_data.setdefault(suite_name, OrderedDict())
+            summary_data.setdefault(suite_name, {})
             for scenario_name in scenarios:
                 summary_data[suite_name][scenario_name] = []
 
     lower_output = normalized_output.lower()
 
-    def locate_positions(phrases: list[str]) -> list[tuple[int, int, str]]:
+    def locate_positions(phrases: list[tuple[str, str]]) -> list[tuple[int, int, str]]:
         positions: list[tuple[int, int, str]] = []
         search_start = 0
-        for phrase in phrases:
-            target = phrase.lower()
-            idx = lower_output.find(target, search_start)
-            if idx == -1:
-                idx = lower_output.find(target)
+        for phrase_lower, phrase in phrases:
+            idx = find_phrase(lower_output, phrase_lower, search_start)
             if idx == -1:
                 continue
             positions.append((idx, idx + len(phrase), phrase))
             search_start = idx + len(phrase)
         return sorted(positions, key=lambda item: item[0])
 
-    suite_positions = locate_positions(list(plan_structure.keys())) if plan_structure else []
+    # Lowercase plan names once; every lookup below searches the lowered output
+    suite_keys = [(suite.lower(), suite) for suite in plan_structure]
+    suite_positions = locate_positions(suite_keys) if suite_keys else []
 
     if suite_positions:
         first_suite_start = suite_positions[0][0]
@@ -531,14 +616,13 @@ def summarize_execution_output(output: str, plan_markdown: str | None = None) ->
     scenario_entries: list[tuple[Optional[int], Optional[int], str, str]] = []
     if plan_structure:
         search_cursor = 0
-        scenario_order: list[tuple[str, str]] = [
-            (suite, scenario) for suite, scenarios in plan_structure.items() for scenario in scenarios
+        scenario_order: list[tuple[str, str, str]] = [
+            (suite, scenario, scenario.lower())
+            for suite, scenarios in plan_structure.items()
+            for scenario in scenarios
         ]
-        for suite_name, scenario_name in scenario_order:
-            target = scenario_name.lower()
-            idx = lower_output.find(target, search_cursor)
-            if idx == -1:
-                idx = lower_output.find(target)
+        for suite_name, scenario_name, scenario_lower in scenario_order:
+            idx = find_phrase(lower_output, scenario_lower, search_cursor)
             if idx == -1:
                 scenario_entries.append((None, None, suite_name, scenario_name))
                 continue
@@ -565,7 +649,7 @@ def summarize_execution_output(output: str, plan_markdown: str | None = None) ->
         segment_text = segment_text.lstrip(" *#:-\n\r\t")
         bullets = extract_bullets(segment_text)
         if bullets:
-            summary_data.setdefault(suite_name, OrderedDict())
+            summary_data.setdefault(suite_name, {})
             summary_data[suite_name].setdefault(scenario_name, [])
             summary_data[suite_name][scenario_name].extend(bullets)
 
@@ -612,7 +696,7 @@ async def run_playwright_test_agent(
         )
 
     plan_markdown = read_test_plan(plan_path)
-    suite_sections = split_plan_into_suites(plan_markdown)
+    suite_sections, plan_outline = parse_plan_structure(plan_markdown)
     prompt = build_execution_prompt(plan_markdown, base_url)
 
     server_process: Optional[subprocess.Popen[str]] = None
@@ -641,14 +725,15 @@ async def run_playwright_test_agent(
             "state resets, and reloads."
         )
 
-    transcript = []
-
     MCP_DIR.mkdir(parents=True, exist_ok=True)
     log_target = log_path or DEFAULT_LOG_PATH
     resolved_log = log_target if log_target.is_absolute() else (MCP_DIR / log_target.name).resolve()
-    log_file_handle = resolved_log.open("w", encoding="utf-8")
+    # Large buffer; the log is flushed per suite rather than per streamed chunk
+    log_file_handle = resolved_log.open("w", encoding="utf-8", buffering=1 << 16)
     timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
     log_file_handle.write(f"# Playwright Test Run\nStarted: {timestamp}\nPlan: {plan_path}\n\n")
+    # The agent transcript is kept only in the log; remember where it starts to read it back
+    transcript_offset = log_file_handle.tell()
 
     agent_kwargs = {
         "name": "PlaywrightRunnerAgent",
@@ -660,8 +745,15 @@ async def run_playwright_test_agent(
     agent_obj = client.as_agent(**agent_kwargs, default_options={"max_tokens": 60000})
     final_run_metrics: Optional[Dict[str, Any]] = None
 
+    # Let the server come up while the Playwright MCP tool is starting
+    server_ready: Optional[asyncio.Task[None]] = None
+    if server_process is not None:
+        server_ready = asyncio.create_task(wait_for_local_server(server_process, url=base_url))
+
     try:
         async with agent_obj as agent:
+            if server_ready is not None:
+                await server_ready
             suites_to_run: list[tuple[Optional[str], Optional[str]]] = (
                 [(name, body) for name, body in suite_sections]
                 if suite_sections
@@ -674,47 +766,100 @@ async def run_playwright_test_agent(
                 suite_total=len(suites_to_run),
             )
             metrics_path = MCP_DIR / "run.metrics.json"
-            response_updates: list[Any] = []
+            # Only force per-chunk echo flushes when someone is watching a terminal
+            echo_flush = echo and sys.stdout.isatty()
+            # With one suite at a time, chunks go straight to the log (and echo); otherwise each
+            # suite is buffered and written in plan order once it finishes.
+            stream_live = SUITE_CONCURRENCY == 1
             if echo:
                 print("Agent: ", end="", flush=True)
-            for index, (suite_name, suite_body) in enumerate(suites_to_run, start=1):
-                try:
-                    metrics_collector.start_suite(suite_name, index)
-                    suite_prompt = prompt
-                    if suite_body is not None:
-                        suite_prompt = build_execution_prompt(
-                            plan_markdown,
-                            base_url,
-                            suite_markdown=suite_body,
-                            suite_name=suite_name,
-                            suite_index=index,
-                            suite_total=len(suites_to_run),
-                        )
-                    thread = agent.get_new_thread()
+
+            suite_semaphore = asyncio.Semaphore(SUITE_CONCURRENCY)
+            suite_failed = False
+            pending_outputs: dict[int, list[str]] = {}
+            next_output_index = 1
+
+            def emit_suite_outputs() -> None:
+                # Write finished suites to the log in plan order
+                nonlocal next_output_index
+                while next_output_index in pending_outputs:
+                    suite_text = "".join(pending_outputs.pop(next_output_index))
+                    log_file_handle.write(suite_text)
+                    log_file_handle.flush()
+                    if echo:
+                        if not stream_live:
+                            print(suite_text, end="", flush=echo_flush)
+                        if next_output_index < len(suites_to_run):
+                            print()
+                    next_output_index += 1
+
+            async def run_suite(index: int, suite_name: Optional[str], suite_body: Optional[str]) -> list[Any]:
+                nonlocal suite_failed
+                async with suite_semaphore:
+                    if suite_failed:
+                        # An earlier suite failed; don't start new ones
+                        return []
+                    suite_record = metrics_collector.begin_suite(suite_name, index)
                     suite_updates: list[Any] = []
-                    async for chunk in agent.run_stream(suite_prompt, thread=thread):
-                        suite_updates.append(chunk)
-                        metrics_collector.record_update(chunk)
-                        if chunk.text:
-                            transcript.append(chunk.text)
-                            log_file_handle.write(chunk.text)
-                            log_file_handle.flush()
-                            if echo:
-                                print(chunk.text, end="", flush=True)
-                    metrics_collector.finish_suite()
-                    response_updates.extend(suite_updates)
-                    if suite_updates and index < len(suites_to_run):
-                        transcript.append("\n")
-                        log_file_handle.write("\n")
-                        log_file_handle.flush()
-                    if echo and index < len(suites_to_run):
-                        print()
-                except Exception as e:
-                    metrics_collector.abort_active_suite()
-                    run_metrics = metrics_collector.finalize_run()
-                    run_metrics.setdefault("run", {}).setdefault("error", str(e))
-                    dump_metrics_to_file(run_metrics, metrics_path)
-                    raise
+                    suite_chunks: list[str] = []
+                    pending_metrics: list[tuple[Any, float]] = []
+                    try:
+                        suite_prompt = prompt
+                        if suite_body is not None:
+                            suite_prompt = build_execution_prompt(
+                                plan_markdown,
+                                base_url,
+                                suite_markdown=suite_body,
+                                suite_name=suite_name,
+                                suite_index=index,
+                                suite_total=len(suites_to_run),
+                            )
+                        thread = agent.get_new_thread()
+                        try:
+                            async for chunk in agent.run_stream(suite_prompt, thread=thread):
+                                suite_updates.append(chunk)
+                                pending_metrics.append((chunk, time.perf_counter()))
+                                if len(pending_metrics) >= METRICS_BATCH_SIZE:
+                                    metrics_collector.record_suite_updates(suite_record, pending_metrics)
+                                    pending_metrics.clear()
+                                if chunk.text:
+                                    if stream_live:
+                                        log_file_handle.write(chunk.text)
+                                        if echo:
+                                            print(chunk.text, end="", flush=echo_flush)
+                                    else:
+                                        suite_chunks.append(chunk.text)
+                        finally:
+                            if pending_metrics:
+                                metrics_collector.record_suite_updates(suite_record, pending_metrics)
+                    except BaseException:
+                        suite_failed = True
+                        metrics_collector.complete_suite(suite_record, aborted=True)
+                        pending_outputs[index] = suite_chunks
+                        emit_suite_outputs()
+                        raise
+                    metrics_collector.complete_suite(suite_record)
+                if suite_updates and index < len(suites_to_run):
+                    suite_chunks.append("\n")
+                pending_outputs[index] = suite_chunks
+                emit_suite_outputs()
+                return suite_updates
+
+            suite_tasks = [
+                asyncio.create_task(run_suite(index, suite_name, suite_body))
+                for index, (suite_name, suite_body) in enumerate(suites_to_run, start=1)
+            ]
+            try:
+                suite_results = await asyncio.gather(*suite_tasks)
+            except Exception as e:
+                for task in suite_tasks:
+                    task.cancel()
+                await asyncio.gather(*suite_tasks, return_exceptions=True)
+                run_metrics = metrics_collector.finalize_run()
+                run_metrics.setdefault("run", {}).setdefault("error", str(e))
+                dump_metrics_to_file(run_metrics, metrics_path)
+                raise
+            response_updates: list[Any] = [update for updates in suite_results for update in updates]
             if echo:
                 print()
             log_agent_stream_metadata(
@@ -732,11 +877,17 @@ async def run_playwright_test_agent(
         log_file_handle.write("\n")
         log_file_handle.flush()
         log_file_handle.close()
+        if server_ready is not None and not server_ready.done():
+            server_ready.cancel()
+            with contextlib.suppress(asyncio.CancelledError, Exception):
+                await server_ready
         if start_server and server_process is not None:
             stop_local_server(server_process)
 
-    output_text = "".join(transcript).strip()
-    summary_text = summarize_execution_output(output_text, plan_markdown)
+    with resolved_log.open("r", encoding="utf-8") as transcript_file:
+        transcript_file.seek(transcript_offset)
+        output_text = transcript_file.read().strip()
+    summary_text = summarize_execution_output(output_text, plan_markdown, plan_structure=plan_outline)
 
     # Write per-MCP comparison summary after computing summary_text
     if final_run_metrics is not None:
@@ -772,9 +923,7 @@ async def run_playwright_test_agent(
             print(f"Summary written to: {summary_path}")
 
     with resolved_log.open("a", encoding="utf-8") as summary_file:
-        summary_file.write("\n# Summary\n")
-        summary_file.write(summary_text)
-        summary_file.write("\n")
+        summary_file.write(f"\n# Summary\n{summary_text}\n")
 
     try:
         relative_plan = plan_path.relative_to(PROJECT_ROOT)
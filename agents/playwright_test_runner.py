@@ -5,21 +5,21 @@ from __future__ import annotations
 import argparse
 import asyncio
 import contextlib
+import io
 import logging
-import socket
 import os
 import re
+import signal
 import subprocess
 import time
 import sys
 import shutil
+from bisect import bisect_right
 from pathlib import Path
-from collections import OrderedDict
+from functools import lru_cache
 from typing import Annotated, Any, Dict, Optional
 
 from agent_framework import MCPStdioTool, ai_function
-from agent_framework.anthropic import AnthropicClient
-from anthropic import AsyncAnthropicFoundry
 from dotenv import load_dotenv
 from pydantic import Field
 
@@ -33,6 +33,11 @@ try:
 except ImportError:
     from agent_metrics import AgentRunMetricsCollector, dump_metrics_to_file
 
+try:
+    from .runner_helpers import find_phrase, is_port_open, wait_for_server
+except ImportError:
+    from runner_helpers import find_phrase, is_port_open, wait_for_server
+
 load_dotenv()
 
 ANTHROPIC_FOUNDRY_ENDPOINT = os.getenv("ANTHROPIC_FOUNDRY_ENDPOINT")
@@ -48,7 +53,9 @@ DEFAULT_SERVER_CWD = Path("artifacts") / "digital-experience-healthcare"
 DEFAULT_BASE_URL = "http://localhost:8000"
 DEFAULT_LOG_PATH = MCP_DIR / "run.log"
 SERVER_READY_TIMEOUT = 15
-SERVER_CHECK_INTERVAL = 0.5
+SERVER_CHECK_INTERVAL = 0.025
+# Suites drive one shared Chrome session, so they run one at a time unless raised
+SUITE_CONCURRENCY = max(1, int(os.getenv("SELENIUM_MCP_SUITE_CONCURRENCY", "1")))
 
 LOGGER = logging.getLogger("playwright_test_runner")
 
@@ -128,16 +135,10 @@ def create_playwright_mcp_tool() -> MCPStdioTool:
         env=env_vars,
     )
 
-def _is_port_open(port: int) -> bool:
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
-        sock.settimeout(1)
-        return sock.connect_ex(("127.0.0.1", port)) == 0
-
-
 def _start_chrome_remote_debug(port: int, profile_dir: Path) -> None:
     if sys.platform != "win32":  # existing Linux logic already handles non-Windows
         return
-    if _is_port_open(port):
+    if is_port_open("127.0.0.1", port):
         return
 
     profile_dir.mkdir(parents=True, exist_ok=True)
@@ -167,15 +168,18 @@ def _start_chrome_remote_debug(port: int, profile_dir: Path) -> None:
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
         )
-        for _ in range(10):
-            if _is_port_open(port):
+        # Chrome usually opens the port well within a second; poll quickly, backing off to 250ms
+        deadline = time.monotonic() + 10
+        delay = 0.05
+        while not is_port_open("127.0.0.1", port):
+            if time.monotonic() >= deadline:
+                LOGGER.warning(
+                    "Chrome launched but remote debugging port %s did not open; Selenium MCP may retry with its own launcher.",
+                    port,
+                )
                 break
-            time.sleep(1)
-        else:
-            LOGGER.warning(
-                "Chrome launched but remote debugging port %s did not open; Selenium MCP may retry with its own launcher.",
-                port,
-            )
+            time.sleep(delay)
+            delay = min(delay * 1.5, 0.25)
     except Exception as exc:
         LOGGER.warning("Failed to launch Chrome for Selenium MCP: %s", exc)
 
@@ -188,25 +192,44 @@ def read_test_plan(plan_path: Path) -> str:
     return plan_path.read_text(encoding="utf-8").strip()
 
 
-def split_plan_into_suites(plan_markdown: str) -> list[tuple[str, str]]:
-    """Break the Markdown plan into per-suite sections."""
+_PLAN_MARKER_CHARS = frozenset("#-")
+
+
+@lru_cache(maxsize=8)
+def split_plan_into_suites(plan_markdown: str) -> tuple[tuple[str, str], ...]:
+    """Break the Markdown plan into per-suite sections (cached per plan text)."""
     suites: list[tuple[str, str]] = []
     current_name: Optional[str] = None
     current_lines: list[str] = []
     for raw_line in plan_markdown.splitlines():
-        stripped = raw_line.strip()
-        if stripped.startswith("## "):
-            if current_name and current_lines:
-                suites.append((current_name, "\n".join(current_lines).strip()))
-            current_name = stripped[3:].strip()
-            current_lines = [stripped]
-        elif current_name:
+        # Only a line that could be a heading or a "---" rule needs a stripped copy
+        first = raw_line[:1]
+        if first in _PLAN_MARKER_CHARS or first.isspace():
+            stripped = raw_line.strip()
+            if stripped.startswith("## "):
+                if current_name and current_lines:
+                    suites.append((current_name, "\n".join(current_lines).strip()))
+                current_name = stripped[3:].strip()
+                current_lines = [stripped]
+                continue
             if stripped == "---":
                 continue
+        if current_name:
             current_lines.append(raw_line)
     if current_name and current_lines:
         suites.append((current_name, "\n".join(current_lines).strip()))
-    return [(name, section) for name, section in suites if section]
+    return tuple((name, section) for name, section in suites if section)
+
+
+_EXECUTION_PROMPT_TEMPLATE = (
+    "You are a QA automation executor. You receive a Playwright test plan in Markdown. "
+    "For each suite and scenario, translate the intent into concrete Playwright test steps. "
+    "Use the Playwright MCP tool to run the necessary tests against the target application. "
+    "{url_directive}{scope_directive}"
+    "Report consolidated pass/fail results, notable logs, and any follow-up actions.\n\n"
+    "Playwright Test Plan:\n\n"
+    "{plan_body}"
+)
 
 
 def build_execution_prompt(
@@ -238,14 +261,8 @@ def build_execution_prompt(
             )
         scope_directive = " ".join(scope_parts) + " "
     plan_body = plan_markdown if suite_markdown is None else f"# Playwright Test Plan\n\n{suite_markdown}"
-    return (
-        "You are a QA automation executor. You receive a Playwright test plan in Markdown. "
-        "For each suite and scenario, translate the intent into concrete Playwright test steps. "
-        "Use the Playwright MCP tool to run the necessary tests against the target application. "
-        f"{url_directive}{scope_directive}"
-        "Report consolidated pass/fail results, notable logs, and any follow-up actions.\n\n"
-        "Playwright Test Plan:\n\n"
-        f"{plan_body}"
+    return _EXECUTION_PROMPT_TEMPLATE.format_map(
+        {"url_directive": url_directive, "scope_directive": scope_directive, "plan_body": plan_body}
     )
 
 
@@ -253,9 +270,8 @@ def start_local_server(
     *,
     command: Optional[list[str]] = None,
     cwd: Optional[Path] = None,
-    timeout: int = SERVER_READY_TIMEOUT,
 ) -> subprocess.Popen[str]:
-    """Start the local server hosting the generated app."""
+    """Start the local server hosting the generated app; see wait_for_local_server."""
     server_cmd = list(command or DEFAULT_SERVER_COMMAND)
     server_cwd = cwd or DEFAULT_SERVER_CWD
     if not server_cwd.is_absolute():
@@ -269,84 +285,116 @@ def start_local_server(
     process = subprocess.Popen(
         server_cmd,
         cwd=server_cwd,
+        # Output is discarded; switching to PIPE needs a reader draining it or the server blocks on writes
         stdout=subprocess.DEVNULL,
         stderr=subprocess.DEVNULL,
         text=True,
+        bufsize=-1,
+        # Own process group on POSIX so stop_local_server can signal anything the server spawns
+        start_new_session=os.name == "posix",
     )
 
-    start_time = time.time()
-    while True:
-        if process.poll() is not None:
-            raise RuntimeError(
-                "Local server terminated unexpectedly before readiness.\n"
-                f"Command: {' '.join(server_cmd)}"
-            )
-        if time.time() - start_time >= timeout:
-            process.terminate()
-            raise TimeoutError(
-                f"Server did not become ready within {timeout} seconds."
-            )
-        time.sleep(SERVER_CHECK_INTERVAL)
-        break
-
     return process
 
 
+async def wait_for_local_server(
+    process: subprocess.Popen[str],
+    *,
+    url: Optional[str] = DEFAULT_BASE_URL,
+    timeout: int = SERVER_READY_TIMEOUT,
+) -> None:
+    """Wait without blocking the event loop until the local server accepts connections."""
+    await asyncio.to_thread(
+        wait_for_server, process, url, timeout=timeout, interval=SERVER_CHECK_INTERVAL
+    )
+
+
 def stop_local_server(process: subprocess.Popen[str]) -> None:
-    """Stop the previously started local server."""
+    """Stop the previously started local server, escalating to a kill after five seconds."""
     if process.poll() is not None:
         return
-    with contextlib.suppress(Exception):
-        process.terminate()
+    use_group = os.name == "posix"
+    with contextlib.suppress(ProcessLookupError):
+        if use_group:
+            os.killpg(process.pid, signal.SIGTERM)
+        else:
+            process.terminate()
+    try:
         process.wait(timeout=5)
-    if process.poll() is None:
-        with contextlib.suppress(Exception):
-            process.kill()
+    except subprocess.TimeoutExpired:
+        with contextlib.suppress(ProcessLookupError):
+            if use_group:
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        with contextlib.suppress(subprocess.TimeoutExpired):
+            process.wait(timeout=5)
+
+
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+_SENTENCE_SPLIT_PATTERN = re.compile(r"(?<=[\.\?\!])\s+(?=[A-Z])")
+# Leading phrases in agent narration rewritten into summary wording
+_SUMMARY_REPLACEMENTS = (
+    ("let me ", "Attempted to "),
+    ("i'll ", "Planned to "),
+    ("i notice ", "Observation: "),
+    ("it appears ", "Observation: "),
+    ("perfect!", "Outcome:"),
+)
+# Same replacements bucketed by first character, in their original order
+_SUMMARY_REPLACEMENTS_BY_INITIAL = {
+    initial: tuple(pair for pair in _SUMMARY_REPLACEMENTS if pair[0][0] == initial)
+    for initial in dict.fromkeys(trigger[0] for trigger, _ in _SUMMARY_REPLACEMENTS)
+}
+
+
+def _sanitize_plan_heading(text: str) -> str:
+    cleaned = _WHITESPACE_PATTERN.sub(" ", text.strip())
+    cleaned = cleaned.strip("* ")
+    return cleaned
+
+
+@lru_cache(maxsize=8)
+def parse_plan_outline(plan_markdown: str) -> tuple[tuple[str, tuple[str, ...]], ...]:
+    """Return the plan's (suite, scenarios) outline; cached per plan text, so it is immutable."""
+    suites: dict[str, list[str]] = {}
+    current_suite: Optional[str] = None
+    for raw_line in plan_markdown.splitlines():
+        stripped = raw_line.strip()
+        if stripped.startswith("## "):
+            suite_name = _sanitize_plan_heading(stripped[3:])
+            current_suite = suite_name or "General"
+            suites.setdefault(current_suite, [])
+            continue
+        if stripped.startswith("###"):
+            scenario_name = _sanitize_plan_heading(stripped.lstrip("#"))
+            if not current_suite:
+                current_suite = "General"
+                suites.setdefault(current_suite, [])
+            suites[current_suite].append(scenario_name)
+    return tuple((suite, tuple(scenarios)) for suite, scenarios in suites.items())
 
 
 def summarize_execution_output(output: str, plan_markdown: str | None = None) -> str:
     """Create a structured summary of the MCP execution output."""
+    # Pure in its inputs, so repeat summaries of the same transcript and plan come from the cache
+    return _summarize_cached(output, plan_markdown or None)
+
+
+@lru_cache(maxsize=16)
+def _summarize_cached(output: str, plan_markdown: Optional[str]) -> str:
     if not output.strip():
         return "No output was produced by PlaywrightRunnerAgent."
 
     normalized_output = output.replace("\r\n", "\n")
 
-    def sanitize_heading(text: str) -> str:
-        cleaned = re.sub(r"\s+", " ", text.strip())
-        cleaned = cleaned.strip("* ")
-        return cleaned
-
-    def parse_plan(markdown: str) -> OrderedDict[str, list[str]]:
-        suites = OrderedDict()
-        current_suite: Optional[str] = None
-        for raw_line in markdown.splitlines():
-            stripped = raw_line.strip()
-            if stripped.startswith("## "):
-                suite_name = sanitize_heading(stripped[3:])
-                current_suite = suite_name or "General"
-                suites.setdefault(current_suite, [])
-                continue
-            if stripped.startswith("###"):
-                scenario_name = sanitize_heading(stripped.lstrip("#"))
-                if not current_suite:
-                    current_suite = "General"
-                    suites.setdefault(current_suite, [])
-                suites[current_suite].append(scenario_name)
-        return suites
-
     def humanize_sentence(sentence: str) -> str:
-        text = re.sub(r"\s+", " ", sentence.strip().rstrip(":"))
+        # Fragments come from lines extract_bullets already collapsed to single spaces
+        text = sentence.strip().rstrip(":")
         if not text:
             return ""
         lowered = text.lower()
-        replacements = [
-            ("let me ", "Attempted to "),
-            ("i'll ", "Planned to "),
-            ("i notice ", "Observation: "),
-            ("it appears ", "Observation: "),
-            ("perfect!", "Outcome:"),
-        ]
-        for trigger, repl in replacements:
+        for trigger, repl in _SUMMARY_REPLACEMENTS_BY_INITIAL.get(lowered[:1], ()):
             if lowered.startswith(trigger):
                 text = repl + text[len(trigger):].lstrip()
                 break
@@ -369,9 +417,12 @@ def summarize_execution_output(output: str, plan_markdown: str | None = None) ->
                 continue
             if raw_line.lower().startswith("summary saved to"):
                 continue
-            normalized = re.sub(r"\s+", " ", raw_line)
-            pieces = re.split(r"(?<=[\.\?\!])\s+(?=[A-Z])", normalized)
-            if not pieces:
+            normalized = _WHITESPACE_PATTERN.sub(" ", raw_line)
+            # Whitespace is now single spaces, so a boundary needs ". ", "? " or "! "; most
+            # lines have none and skip the lookaround split entirely
+            if ". " in normalized or "? " in normalized or "! " in normalized:
+                pieces = _SENTENCE_SPLIT_PATTERN.split(normalized)
+            else:
                 pieces = [normalized]
             for piece in pieces:
                 fragments.append(piece.strip())
@@ -387,17 +438,27 @@ def summarize_execution_output(output: str, plan_markdown: str | None = None) ->
                 continue
             seen.add(key)
             bullets.append(f"- {sentence}")
-        return bullets[:5]
+            if len(bullets) == 5:
+                break
+        return bullets
+
+    plan_outline = parse_plan_outline(plan_markdown) if plan_markdown else ()
+    if not plan_outline:
+        # Without suites to locate, the summary is just the overview bullets
+        overview = extract_bullets(normalized_output)
+        if not overview:
+            return "# Playwright MCP Test Summary\n"
+        return "# Playwright MCP Test Summary\n\n## General\n### Overview\n" + "\n".join(overview) + "\n"
 
-    plan_structure = parse_plan(plan_markdown) if plan_markdown else OrderedDict()
+    plan_structure = dict(plan_outline)
 
-    summary_data: OrderedDict[str, OrderedDict[str, list[str]]] = OrderedDict()
-    summary_data["General"] = OrderedDict()
+    summary_data: dict[str, dict[str, list[str]]] = {}
+    summary_data["General"] = {}
     summary_data["General"]["Overview"] = []
 
     if plan_structure:
         for suite_name, scenarios in plan_structure.items():
-            summary_data.setdefault(suite_name, OrderedDict())
+            summary_data.setdefault(suite_name, {})
             for scenario_name in scenarios:
                 summary_data[suite_name][scenario_name] = []
 
@@ -407,10 +468,7 @@ def summarize_execution_output(output: str, plan_markdown: str | None = None) ->
         positions: list[tuple[int, int, str]] = []
         search_start = 0
         for phrase in phrases:
-            target = phrase.lower()
-            idx = lower_output.find(target, search_start)
-            if idx == -1:
-                idx = lower_output.find(target)
+            idx = find_phrase(lower_output, phrase.lower(), search_start)
             if idx == -1:
                 continue
             positions.append((idx, idx + len(phrase), phrase))
@@ -421,15 +479,26 @@ def summarize_execution_output(output: str, plan_markdown: str | None = None) ->
 
     if suite_positions:
         first_suite_start = suite_positions[0][0]
-        general_segment = normalized_output[:first_suite_start].strip()
-        general_bullets = extract_bullets(general_segment)
-        if general_bullets:
-            summary_data["General"]["Overview"].extend(general_bullets)
+        # Only text before the first suite feeds the overview; there is none when the
+        # transcript opens with a suite name
+        if first_suite_start:
+            general_bullets = extract_bullets(normalized_output[:first_suite_start])
+            if general_bullets:
+                summary_data["General"]["Overview"].extend(general_bullets)
     else:
         general_bullets = extract_bullets(normalized_output)
         if general_bullets:
             summary_data["General"]["Overview"].extend(general_bullets)
 
+    # Each located suite owns the transcript up to the next located suite; its scenarios are
+    # looked for there first so one search doesn't run on into later suites
+    suite_windows: dict[str, tuple[int, int]] = {}
+    for position, (suite_start, _, suite_name) in enumerate(suite_positions):
+        window_end = (
+            suite_positions[position + 1][0] if position + 1 < len(suite_positions) else len(lower_output)
+        )
+        suite_windows[suite_name] = (suite_start, window_end)
+
     scenario_entries: list[tuple[Optional[int], Optional[int], str, str]] = []
     if plan_structure:
         search_cursor = 0
@@ -438,9 +507,12 @@ def summarize_execution_output(output: str, plan_markdown: str | None = None) ->
         ]
         for suite_name, scenario_name in scenario_order:
             target = scenario_name.lower()
-            idx = lower_output.find(target, search_cursor)
+            idx = -1
+            window = suite_windows.get(suite_name)
+            if window is not None and search_cursor < window[1]:
+                idx = lower_output.find(target, max(window[0], search_cursor), window[1])
             if idx == -1:
-                idx = lower_output.find(target)
+                idx = find_phrase(lower_output, target, search_cursor)
             if idx == -1:
                 scenario_entries.append((None, None, suite_name, scenario_name))
                 continue
@@ -449,25 +521,29 @@ def summarize_execution_output(output: str, plan_markdown: str | None = None) ->
 
     suite_boundaries = [pos for pos, _, _ in suite_positions]
 
+    # Start of the next located scenario after each entry, filled in from the back
+    next_scenario_starts: list[Optional[int]] = [None] * len(scenario_entries)
+    upcoming_start: Optional[int] = None
+    for index in range(len(scenario_entries) - 1, -1, -1):
+        next_scenario_starts[index] = upcoming_start
+        if scenario_entries[index][0] is not None:
+            upcoming_start = scenario_entries[index][0]
+
     for index, (start, end, suite_name, scenario_name) in enumerate(scenario_entries):
         if start is None or end is None:
             continue
         boundary_candidates: list[int] = []
-        for next_index in range(index + 1, len(scenario_entries)):
-            next_start = scenario_entries[next_index][0]
-            if next_start is not None:
-                boundary_candidates.append(next_start)
-                break
-        for suite_start in suite_boundaries:
-            if suite_start > end:
-                boundary_candidates.append(suite_start)
-                break
+        if next_scenario_starts[index] is not None:
+            boundary_candidates.append(next_scenario_starts[index])
+        boundary_index = bisect_right(suite_boundaries, end)
+        if boundary_index < len(suite_boundaries):
+            boundary_candidates.append(suite_boundaries[boundary_index])
         segment_end = min(boundary_candidates) if boundary_candidates else len(normalized_output)
         segment_text = normalized_output[end:segment_end]
         segment_text = segment_text.lstrip(" *#:-\n\r\t")
         bullets = extract_bullets(segment_text)
         if bullets:
-            summary_data.setdefault(suite_name, OrderedDict())
+            summary_data.setdefault(suite_name, {})
             summary_data[suite_name].setdefault(scenario_name, [])
             summary_data[suite_name][scenario_name].extend(bullets)
 
@@ -491,6 +567,41 @@ def summarize_execution_output(output: str, plan_markdown: str | None = None) ->
     return summary + "\n"
 
 
+def _create_agent_context(base_url: Optional[str]) -> Any:
+    """Build the PlaywrightRunnerAgent context manager; entering it starts the MCP tool."""
+    # The Anthropic SDK is only needed to run tests, not for the plan/summary helpers
+    from agent_framework.anthropic import AnthropicClient
+    from anthropic import AsyncAnthropicFoundry
+
+    client = AnthropicClient(
+        model_id=ANTHROPIC_FOUNDRY_DEPLOYMENT,
+        anthropic_client=AsyncAnthropicFoundry(
+            api_key=ANTHROPIC_FOUNDRY_API_KEY,
+            base_url=ANTHROPIC_FOUNDRY_ENDPOINT,
+        ),
+    )
+
+    instructions = (
+        "You are PlaywrightRunnerAgent. When the user provides a Playwright test plan, "
+        "parse the scenarios, call the Playwright MCP tool to execute the relevant tests, "
+        "and provide a detailed but concise report of execution results."
+    )
+    if base_url:
+        instructions += (
+            f" The application is hosted at {base_url}; stay on this origin for all navigation, "
+            "state resets, and reloads."
+        )
+
+    agent_kwargs = {
+        "name": "PlaywrightRunnerAgent",
+        "instructions": instructions,
+        "tools": [create_playwright_mcp_tool()],
+        "allow_multiple_tool_calls": True,
+    }
+
+    return client.as_agent(max_output_tokens=60000, **agent_kwargs)
+
+
 async def run_playwright_test_agent(
     plan_path: Path,
     *,
@@ -513,7 +624,7 @@ async def run_playwright_test_agent(
             "Missing environment variables: " + ", ".join(missing)
         )
 
-    plan_markdown = read_test_plan(plan_path)
+    plan_markdown = await asyncio.to_thread(read_test_plan, plan_path)
     suite_sections = split_plan_into_suites(plan_markdown)
     suite_total = len(suite_sections) if suite_sections else 1
     try:
@@ -526,100 +637,129 @@ async def run_playwright_test_agent(
         base_url=base_url,
         suite_total=suite_total,
     )
-    prompt = build_execution_prompt(plan_markdown, base_url)
 
     server_process: Optional[subprocess.Popen[str]] = None
     if start_server:
-        server_process = start_local_server(
-            command=server_command,
-            cwd=server_cwd,
-        )
-
-    client = AnthropicClient(
-        model_id=ANTHROPIC_FOUNDRY_DEPLOYMENT,
-        anthropic_client=AsyncAnthropicFoundry(
-            api_key=ANTHROPIC_FOUNDRY_API_KEY,
-            base_url=ANTHROPIC_FOUNDRY_ENDPOINT,
-        ),
-    )
-
-    instructions = (
-        "You are PlaywrightRunnerAgent. When the user provides a Playwright test plan, "
-        "parse the scenarios, call the Playwright MCP tool to execute the relevant tests, "
-        "and provide a detailed but concise report of execution results."
-    )
-    if base_url:
-        instructions += (
-            f" The application is hosted at {base_url}; stay on this origin for all navigation, "
-            "state resets, and reloads."
-        )
+        server_process = start_local_server(command=server_command, cwd=server_cwd)
+        try:
+            await wait_for_local_server(server_process, url=base_url)
+        except BaseException:
+            # Also covers cancellation and Ctrl-C, which the server's own session never sees
+            stop_local_server(server_process)
+            raise
 
-    transcript = []
+    transcript = io.StringIO()
     MCP_DIR.mkdir(parents=True, exist_ok=True)
     log_target = log_path or DEFAULT_LOG_PATH
     resolved_log = log_target if log_target.is_absolute() else (MCP_DIR / log_target.name).resolve()
-    log_file_handle = resolved_log.open("w", encoding="utf-8")
+    # emit_suite_outputs flushes after each suite, so buffer a suite's worth of text
+    log_file_handle = resolved_log.open("w", encoding="utf-8", buffering=1 << 16)
     metrics_path = MCP_DIR / "run.metrics.json"
     timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
     log_file_handle.write(f"# Playwright Test Run\nStarted: {timestamp}\nPlan: {plan_path}\n\n")
 
-    agent_kwargs = {
-        "name": "PlaywrightRunnerAgent",
-        "instructions": instructions,
-        "tools": [create_playwright_mcp_tool()],
-        "allow_multiple_tool_calls": True,
-    }
-
-    context_manager = client.as_agent(max_output_tokens=60000, **agent_kwargs)
-
     metrics_data: dict[str, Any] | None = None
     metrics_error: Exception | None = None
 
     try:
-        async with context_manager as agent:
+        async with _create_agent_context(base_url) as agent:
             suites_to_run: list[tuple[Optional[str], Optional[str]]] = (
                 [(name, body) for name, body in suite_sections]
                 if suite_sections
                 else [(None, None)]
             )
-            response_updates: list[Any] = []
             if echo:
                 print("Agent: ", end="", flush=True)
-            for index, (suite_name, suite_body) in enumerate(suites_to_run, start=1):
-                suite_prompt = prompt
-                if suite_body is not None:
-                    suite_prompt = build_execution_prompt(
-                        plan_markdown,
-                        base_url,
-                        suite_markdown=suite_body,
-                        suite_name=suite_name,
-                        suite_index=index,
-                        suite_total=len(suites_to_run),
-                    )
-                thread = agent.get_new_thread()
-                suite_updates: list[Any] = []
-                metrics_collector.start_suite(suite_name, index)
-                try:
-                    async for chunk in agent.run_stream(suite_prompt, thread=thread):
-                        suite_updates.append(chunk)
-                        if chunk.text:
-                            transcript.append(chunk.text)
-                            log_file_handle.write(chunk.text)
-                            log_file_handle.flush()
-                            if echo:
-                                print(chunk.text, end="", flush=True)
-                        metrics_collector.record_update(chunk)
-                except Exception:
-                    metrics_collector.abort_active_suite()
-                    raise
-                response_updates.extend(suite_updates)
-                metrics_collector.finish_suite()
-                if suite_updates and index < len(suites_to_run):
-                    transcript.append("\n")
-                    log_file_handle.write("\n")
-                    log_file_handle.flush()
-                if echo and index < len(suites_to_run):
-                    print()
+
+            # With one suite at a time, text is streamed as it arrives; otherwise each suite
+            # is buffered and appended in plan order once it finishes.
+            stream_live = SUITE_CONCURRENCY == 1
+            suite_semaphore = asyncio.Semaphore(SUITE_CONCURRENCY)
+            suite_failed = False
+            pending_outputs: dict[int, tuple[str, bool, bool]] = {}  # index -> (text, completed, had updates)
+            next_output_index = 1
+
+            # Output is flushed once per suite; per-chunk echo flushes only when a terminal is watching
+            stdout = sys.stdout
+            echo_flush = echo and stdout.isatty()
+
+            def append_output(text: str, *, echo_text: bool) -> None:
+                transcript.write(text)
+                log_file_handle.write(text)
+                if echo and echo_text:
+                    stdout.write(text)
+                    if echo_flush:
+                        stdout.flush()
+
+            def emit_suite_outputs() -> None:
+                nonlocal next_output_index
+                while next_output_index in pending_outputs:
+                    suite_text, completed, had_updates = pending_outputs.pop(next_output_index)
+                    if suite_text:
+                        append_output(suite_text, echo_text=not stream_live)
+                    if completed and next_output_index < len(suites_to_run):
+                        if had_updates:
+                            append_output("\n", echo_text=False)
+                        if echo:
+                            print()
+                    next_output_index += 1
+                log_file_handle.flush()
+                if echo:
+                    sys.stdout.flush()
+
+            async def run_suite(index: int, suite_name: Optional[str], suite_body: Optional[str]) -> list[Any]:
+                nonlocal suite_failed
+                async with suite_semaphore:
+                    if suite_failed:
+                        return []
+                    if suite_body is None:
+                        # No suite headings: the whole plan runs as a single pass
+                        suite_prompt = build_execution_prompt(plan_markdown, base_url)
+                    else:
+                        suite_prompt = build_execution_prompt(
+                            plan_markdown,
+                            base_url,
+                            suite_markdown=suite_body,
+                            suite_name=suite_name,
+                            suite_index=index,
+                            suite_total=len(suites_to_run),
+                        )
+                    thread = agent.get_new_thread()
+                    suite_updates: list[Any] = []
+                    suite_chunks: list[str] = []
+                    suite_record = metrics_collector.begin_suite(suite_name, index)
+                    try:
+                        async for chunk in agent.run_stream(suite_prompt, thread=thread):
+                            suite_updates.append(chunk)
+                            if chunk.text:
+                                if stream_live:
+                                    append_output(chunk.text, echo_text=True)
+                                else:
+                                    suite_chunks.append(chunk.text)
+                            metrics_collector.record_suite_update(suite_record, chunk)
+                    except BaseException:
+                        suite_failed = True
+                        metrics_collector.complete_suite(suite_record, aborted=True)
+                        pending_outputs[index] = ("".join(suite_chunks), False, bool(suite_updates))
+                        emit_suite_outputs()
+                        raise
+                    metrics_collector.complete_suite(suite_record)
+                pending_outputs[index] = ("".join(suite_chunks), True, bool(suite_updates))
+                emit_suite_outputs()
+                return suite_updates
+
+            suite_tasks = [
+                asyncio.create_task(run_suite(index, suite_name, suite_body))
+                for index, (suite_name, suite_body) in enumerate(suites_to_run, start=1)
+            ]
+            try:
+                suite_results = await asyncio.gather(*suite_tasks)
+            except BaseException:
+                for task in suite_tasks:
+                    task.cancel()
+                await asyncio.gather(*suite_tasks, return_exceptions=True)
+                raise
+            response_updates: list[Any] = [update for updates in suite_results for update in updates]
             if echo:
                 print()
             log_agent_stream_metadata(
@@ -630,7 +770,6 @@ async def run_playwright_test_agent(
         metrics_data = metrics_collector.finalize_run()
     except Exception as exc:
         metrics_error = exc
-        metrics_collector.abort_active_suite()
     finally:
         log_file_handle.write("\n")
         log_file_handle.flush()
@@ -638,7 +777,7 @@ async def run_playwright_test_agent(
         if start_server and server_process is not None:
             stop_local_server(server_process)
 
-    output_text = "".join(transcript).strip()
+    output_text = transcript.getvalue().strip()
     summary_text = summarize_execution_output(output_text, plan_markdown)
 
     if metrics_data is None:
@@ -646,7 +785,6 @@ async def run_playwright_test_agent(
             metrics_data = metrics_collector.finalize_run()
         except RuntimeError as exc:
             LOGGER.warning("Unable to finalize metrics: %s", exc)
-            metrics_collector.abort_active_suite()
             metrics_data = {
                 "run": {
                     "plan_path": plan_display_path,
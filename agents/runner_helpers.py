@@ -0,0 +1,97 @@
+"""Helpers shared by the Playwright and Selenium MCP test runners."""
+
+from __future__ import annotations
+
+import errno
+import select
+import socket
+import subprocess
+import time
+from typing import Optional
+from urllib.parse import urlsplit
+
+# connect_ex codes meaning a non-blocking connect is still in flight (WSAEWOULDBLOCK on Windows)
+_CONNECT_PENDING = frozenset(
+    {errno.EINPROGRESS, errno.EWOULDBLOCK, getattr(errno, "WSAEWOULDBLOCK", errno.EWOULDBLOCK)}
+)
+
+
+def find_phrase(text: str, target: str, cursor: int) -> int:
+    """Index of ``target`` in ``text`` at or after ``cursor``, else its first index before it; -1 if absent."""
+    idx = text.find(target, cursor)
+    if idx == -1 and cursor:
+        # Only the prefix the first search skipped is left, so a missing phrase costs one pass
+        idx = text.find(target, 0, cursor + len(target) - 1)
+    return idx
+
+
+def server_address(url: Optional[str]) -> Optional[tuple[str, int]]:
+    """Return the (host, port) a base URL is served on, or None if it cannot be probed."""
+    if not url:
+        return None
+    parts = urlsplit(url)
+    try:
+        port = parts.port or (443 if parts.scheme == "https" else 80)
+    except ValueError:
+        return None
+    if not parts.hostname:
+        return None
+    return parts.hostname, port
+
+
+def is_port_open(host: str, port: int, timeout: float = 0.05) -> bool:
+    """Return True if any address ``host`` resolves to accepts a TCP connection on ``port``."""
+    try:
+        addresses = socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+    except OSError:
+        return False
+    # Try each resolved address (IPv4 and IPv6) until one accepts
+    for family, sock_type, proto, _, sock_address in addresses:
+        try:
+            with socket.socket(family, sock_type, proto) as sock:
+                sock.setblocking(False)
+                result = sock.connect_ex(sock_address)
+                if result == 0:
+                    return True
+                if result not in _CONNECT_PENDING:
+                    continue
+                # Windows reports a refused non-blocking connect through the exception set
+                _, writable, failed = select.select([], [sock], [sock], timeout)
+                if writable and not failed and sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                    return True
+        except OSError:
+            continue
+    return False
+
+
+def wait_for_server(
+    process: subprocess.Popen[str],
+    url: Optional[str],
+    *,
+    timeout: float,
+    interval: float,
+) -> None:
+    """Block until ``url`` accepts connections, raising if ``process`` exits or ``timeout`` passes.
+
+    The process is left running on timeout; stopping it is up to the caller.
+    """
+    address = server_address(url)
+    start_time = time.monotonic()
+    while True:
+        if process.poll() is not None:
+            raise RuntimeError(
+                "Local server terminated unexpectedly before readiness.\n"
+                f"Command: {' '.join(process.args)}"
+            )
+        if address is not None and is_port_open(*address, timeout=0.2):
+            return
+        elapsed = time.monotonic() - start_time
+        if elapsed >= timeout:
+            raise TimeoutError(
+                f"Server did not become ready within {timeout} seconds."
+            )
+        if address is None:
+            # No host or port to check; allow half a second for the bind
+            time.sleep(0.5)
+            return
+        time.sleep(min(interval, timeout - elapsed))